@@ -8,14 +8,192 @@ Gère la lecture et le contrôle des différents systèmes multimédias de la ma
 import logging
 import json
 import time
+import asyncio
+import concurrent.futures
+import functools
 import threading
 import subprocess
 import requests
+import aiohttp
 import os
-from typing import Dict, Any, List, Optional, Union
+from array import array
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Union
+
+# Agrégations vectorisées sur l'ensemble des périphériques (optionnelle)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from modules.module_interface import ModuleInterface
 
+# -----------------------------------------------------------------------------------
+# Classe pour représenter l'état d'un périphérique multimédia
+@dataclass(slots=True)
+class DeviceStatus:
+    online: bool = False
+    playing: bool = False
+    volume: int = 0
+    muted: bool = False
+    current_media: Optional[Dict[str, Any]] = None
+    # Champs propres à certains types de périphériques
+    power: Optional[bool] = None
+    input: Optional[str] = None
+    channel: Optional[str] = None
+    current_app: Optional[str] = None
+    position: int = 0
+    duration: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _STATUS_FIELD_NAMES}
+
+# Noms des champs dans l'ordre de déclaration (to_dict) et ensemble pour les tests d'appartenance
+_STATUS_FIELD_NAMES = tuple(field.name for field in fields(DeviceStatus))
+_STATUS_FIELDS = frozenset(_STATUS_FIELD_NAMES)
+
+# -----------------------------------------------------------------------------------
+# Table des états en colonnes (une entrée par périphérique) pour les agrégations
+class DeviceStatusTable:
+    __slots__ = ("index", "online", "playing", "muted", "volume")
+
+    def __init__(self, device_ids):
+        self.index = {device_id: i for i, device_id in enumerate(device_ids)}
+        count = len(self.index)
+        if NUMPY_AVAILABLE:
+            self.online = np.zeros(count, dtype=bool)
+            self.playing = np.zeros(count, dtype=bool)
+            self.muted = np.zeros(count, dtype=bool)
+            self.volume = np.zeros(count, dtype=np.uint8)
+        else:
+            self.online = array("b", bytes(count))
+            self.playing = array("b", bytes(count))
+            self.muted = array("b", bytes(count))
+            self.volume = array("B", bytes(count))
+
+    def set(self, device_id: str, status: DeviceStatus) -> None:
+        idx = self.index.get(device_id)
+        if idx is None:
+            return
+        self.online[idx] = bool(status.online)
+        self.playing[idx] = bool(status.playing)
+        self.muted[idx] = bool(status.muted)
+        self.volume[idx] = max(0, min(255, int(status.volume or 0)))
+
+    def summary(self) -> Dict[str, Any]:
+        if NUMPY_AVAILABLE:
+            online = int(np.count_nonzero(self.online))
+            playing = int(np.count_nonzero(self.playing))
+            muted = int(np.count_nonzero(self.muted))
+            volumes = self.volume[self.online]
+            average_volume = float(volumes.mean()) if volumes.size else None
+        else:
+            online = sum(self.online)
+            playing = sum(self.playing)
+            muted = sum(self.muted)
+            volumes = [volume for volume, is_online in zip(self.volume, self.online) if is_online]
+            average_volume = sum(volumes) / len(volumes) if volumes else None
+        
+        return {
+            "devices": len(self.index),
+            "online": online,
+            "playing": playing,
+            "muted": muted,
+            "average_volume": average_volume
+        }
+
+# États simulés constants, partagés en lecture seule
+_SPEAKER_DEFAULT = MappingProxyType({
+    "online": True,
+    "playing": False,
+    "volume": 40,
+    "muted": False
+})
+
+_CAST_DEFAULT = MappingProxyType({
+    "online": True,
+    "playing": False,
+    "volume": 30,
+    "muted": False,
+    "current_app": "Netflix",
+    "current_media": None
+})
+
+def ttl_cache(method):
+    """
+    Décorateur mettant en cache l'état récupéré d'un périphérique pendant
+    `status_cache_ttl` secondes, par identifiant de périphérique.
+    
+    Args:
+        method: Méthode de récupération d'état à décorer
+        
+    Returns:
+        Méthode décorée
+    """
+    @functools.wraps(method)
+    def wrapper(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.monotonic()
+        cached = self._status_cache.get(device["id"])
+        if cached and now - cached[0] < self._status_ttl:
+            return cached[1]
+        
+        status = method(self, device)
+        self._status_cache[device["id"]] = (now, status)
+        return status
+    return wrapper
+
+def stale_while_refresh(method):
+    """
+    Décorateur renvoyant immédiatement le dernier état connu d'un périphérique.
+    
+    Un état plus ancien que `status_cache_ttl` mais plus récent que
+    `status_stale_ttl` est renvoyé tel quel pendant qu'un rafraîchissement est
+    lancé en arrière-plan dans le pool d'interrogation ; au-delà, l'état est
+    récupéré immédiatement.
+    
+    Args:
+        method: Méthode de récupération d'état à décorer
+        
+    Returns:
+        Méthode décorée
+    """
+    def refresh(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            status = method(self, device)
+            self._status_cache[device["id"]] = (time.monotonic(), status)
+            return status
+        finally:
+            self._refresh_inflight.discard(device["id"])
+    
+    def background_refresh(self, device: Dict[str, Any]) -> None:
+        # Le résultat du Future n'est jamais lu : l'erreur est journalisée ici
+        try:
+            refresh(self, device)
+        except Exception as e:
+            self.logger.error(f"Erreur lors du rafraîchissement de l'état de {device['id']}: {str(e)}",
+                              exc_info=True)
+    
+    @functools.wraps(method)
+    def wrapper(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        device_id = device["id"]
+        cached = self._status_cache.get(device_id)
+        if cached:
+            age = time.monotonic() - cached[0]
+            if age < self._status_ttl:
+                return cached[1]
+            if age < self._status_stale_ttl and self._poll_pool:
+                if device_id not in self._refresh_inflight:
+                    self._refresh_inflight.add(device_id)
+                    self._poll_pool.submit(background_refresh, self, device)
+                return cached[1]
+        
+        self._refresh_inflight.add(device_id)
+        return refresh(self, device)
+    return wrapper
+
+
 class MediaModule(ModuleInterface):
     """
     Module de gestion des médias pour la maison intelligente.
@@ -23,6 +201,29 @@ class MediaModule(ModuleInterface):
     systèmes audio, lecteurs de streaming, etc.
     """
     
+    # Attributs d'instance propres au module (ceux de l'interface sont déclarés par la base)
+    __slots__ = (
+        "default_config", "devices", "active_devices", "status_thread", "running",
+        "message_bus", "state_manager", "_loop", "_http", "_poll_handle", "_poll_task",
+        "_poll_pool", "_actions", "_default_device", "_status_cache", "_status_ttl",
+        "_status_stale_ttl", "_refresh_inflight", "_poll_semaphore", "_status_table"
+    )
+    
+    # Capacités de chaque type de périphérique
+    _CAPABILITIES = {
+        "tv": ["on_off", "volume", "input_selection", "channel"],       # HDMI-CEC, télécommande, etc.
+        "speaker": ["volume", "playback"],                               # Système audio
+        "media_player": ["volume", "playback", "playlist"],              # Lecteur multimédia
+        "cast": ["volume", "playback", "apps"],                          # Google Cast, Chromecast, etc.
+        "kodi": ["volume", "playback", "library", "addons"]              # Kodi, adresse IP, port, etc.
+    }
+    
+    # Modèles de réponse des commandes de lecture, copiés à chaque message
+    _REPLY_TEMPLATES = {
+        action: {"success": True, "device_id": None, "action": action}
+        for action in ("play", "pause", "stop", "next", "previous", "volume", "mute")
+    }
+    
     def __init__(self, module_id: str, config: Dict[str, Any] = None):
         """
         Initialise le module de gestion des médias.
@@ -39,7 +240,15 @@ class MediaModule(ModuleInterface):
             "devices": {},
             "default_device": None,
             "volume_step": 5,
-            "polling_interval": 30
+            "polling_interval": 30,
+            "max_polling_interval": 600,
+            "http_pool_size": 32,
+            "http_connect_timeout": 1.0,
+            "http_timeout": 2.0,
+            "status_cache_ttl": 5.0,
+            "status_stale_ttl": 15.0,
+            "status_timeout": 1.5,
+            "max_concurrent_polls": 16
         }
         
         # Fusionner avec la configuration fournie
@@ -50,6 +259,19 @@ class MediaModule(ModuleInterface):
         self.active_devices = {}
         self.status_thread = None
         self.running = False
+        self._loop = None
+        self._http = None
+        self._poll_handle = None
+        self._poll_task = None
+        self._poll_pool = None
+        self._poll_semaphore = asyncio.Semaphore(self.config["max_concurrent_polls"])
+        self._actions = {}
+        self._default_device = None
+        self._status_cache = {}
+        self._status_ttl = self.config["status_cache_ttl"]
+        self._status_stale_ttl = self.config["status_stale_ttl"]
+        self._refresh_inflight = set()
+        self._status_table = DeviceStatusTable(())
         self.message_bus = None
         self.state_manager = None
     
@@ -72,12 +294,25 @@ class MediaModule(ModuleInterface):
         
         # Initialiser les périphériques configurés
         self._initialize_devices()
+        self._default_device = self.config["default_device"]
+        self._status_table = DeviceStatusTable(self.devices)
         
-        # Démarrer le thread de surveillance de l'état des périphériques
+        # Pool borné pour les récupérations d'état synchrones (E/S bloquantes)
+        self._poll_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4, len(self.devices) or 1),
+            thread_name_prefix="media-poll"
+        )
+        
+        # Démarrer la boucle asyncio de surveillance dans un thread dédié
         self.running = True
-        self.status_thread = threading.Thread(target=self._status_thread_func, daemon=True)
+        self._loop = asyncio.new_event_loop()
+        self.status_thread = threading.Thread(target=self._run_event_loop, daemon=True)
         self.status_thread.start()
         
+        # Session HTTP partagée, créée dans la boucle qui l'utilisera
+        self._http = asyncio.run_coroutine_threadsafe(self._create_http_session(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._schedule_poll, 0)
+        
         # Enregistrer les gestionnaires de messages
         self._register_message_handlers()
         
@@ -94,9 +329,24 @@ class MediaModule(ModuleInterface):
         self.logger.info("Nettoyage du module de gestion des médias")
         self.running = False
         
+        if self._loop:
+            try:
+                asyncio.run_coroutine_threadsafe(self._stop_polling(), self._loop).result(timeout=3.0)
+            except Exception as e:
+                self.logger.error(f"Erreur lors de l'arrêt de la surveillance des périphériques: {str(e)}")
+            
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        
         if self.status_thread and self.status_thread.is_alive():
             self.status_thread.join(timeout=3.0)
         
+        if self._loop and not self._loop.is_running():
+            self._loop.close()
+        
+        if self._poll_pool:
+            self._poll_pool.shutdown(wait=False, cancel_futures=True)
+            self._poll_pool = None
+        
         # Arrêter tous les médias en cours de lecture
         for device_id in list(self.active_devices.keys()):
             self.stop_playback(device_id)
@@ -127,7 +377,7 @@ class MediaModule(ModuleInterface):
         
         return capabilities
         
-    def _get_kodi_status(self, device: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_kodi_status(self, device: Dict[str, Any]) -> Dict[str, Any]:
         """Récupère l'état d'un système Kodi."""
         # Dans une implémentation réelle, on utiliserait l'API JSON-RPC de Kodi
         config = device["config"]
@@ -209,217 +459,102 @@ class MediaModule(ModuleInterface):
             "type": device_type,
             "name": config.get("name", device_id),
             "config": config,
-            "status": {
-                "online": False,
-                "playing": False,
-                "volume": 0,
-                "muted": False,
-                "current_media": None
-            }
+            "next_poll_at": 0.0,
+            "poll_backoff": self.config["polling_interval"],
+            "refresh_generation": 0,
+            "status": DeviceStatus()
         }
         
         # Ajouter des capacités spécifiques au type de périphérique
-        if device_type == "tv":
-            device_info["capabilities"] = ["on_off", "volume", "input_selection", "channel"]
-            # Connexion HDMI-CEC, configuration de la télécommande, etc.
-        
-        elif device_type == "speaker":
-            device_info["capabilities"] = ["volume", "playback"]
-            # Configuration du système audio, protocole de communication, etc.
-        
-        elif device_type == "media_player":
-            device_info["capabilities"] = ["volume", "playback", "playlist"]
-            # Configuration du lecteur multimédia, applications supportées, etc.
-        
-        elif device_type == "cast":
-            device_info["capabilities"] = ["volume", "playback", "apps"]
-            # Configuration pour Google Cast, Chromecast, etc.
-        
-        elif device_type == "kodi":
-            device_info["capabilities"] = ["volume", "playback", "library", "addons"]
-            # Configuration pour Kodi, adresse IP, port, etc.
-        
-        else:
+        if device_type not in self._CAPABILITIES:
             self.logger.warning(f"Type de périphérique inconnu: {device_type}")
-            device_info["capabilities"] = []
+        device_info["capabilities"] = list(self._CAPABILITIES.get(device_type, []))
         
         return device_info
     
     def _register_message_handlers(self) -> None:
         """Enregistre les gestionnaires de messages pour le bus de messages."""
-        handlers = {
-            "media/play": self._handle_play,
-            "media/pause": self._handle_pause,
-            "media/stop": self._handle_stop,
-            "media/next": self._handle_next,
-            "media/previous": self._handle_previous,
-            "media/volume": self._handle_volume,
-            "media/mute": self._handle_mute,
-            "media/status": self._handle_status_request
+        # Topic -> (action, méthode de contrôle, champ d'état renvoyé dans la réponse)
+        self._actions = {
+            "media/play": ("play", self._do_play, None),
+            "media/pause": ("pause", lambda device_id, message: self.pause_playback(device_id), None),
+            "media/stop": ("stop", lambda device_id, message: self.stop_playback(device_id), None),
+            "media/next": ("next", lambda device_id, message: self.next_track(device_id), None),
+            "media/previous": ("previous", lambda device_id, message: self.previous_track(device_id), None),
+            "media/volume": ("volume", self._do_volume, "volume"),
+            "media/mute": ("mute", self._do_mute, "muted")
         }
         
-        for topic, handler in handlers.items():
-            self.message_bus.subscribe(topic, handler)
+        for topic in self._actions:
+            self.message_bus.subscribe(topic, functools.partial(self._generic_handler, topic))
             self.logger.debug(f"Gestionnaire enregistré pour le topic: {topic}")
-    
-    # Gestionnaires de messages
-    
-    def _handle_play(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de lecture."""
-        device_id = message.get("device_id", self.config["default_device"])
-        media_uri = message.get("uri")
-        media_type = message.get("type")
-        
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
-        
-        if media_uri:
-            # Lecture d'un média spécifique
-            self.play_media(device_id, media_uri, media_type)
-        else:
-            # Reprise de la lecture
-            self.resume_playback(device_id)
         
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "play"
-            })
+        self.message_bus.subscribe("media/status", self._handle_status_request)
+        self.logger.debug("Gestionnaire enregistré pour le topic: media/status")
     
-    def _handle_pause(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de pause."""
-        device_id = message.get("device_id", self.config["default_device"])
-        
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
-        
-        self.pause_playback(device_id)
-        
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "pause"
-            })
+    # Gestionnaires de messages
     
-    def _handle_stop(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes d'arrêt."""
-        device_id = message.get("device_id", self.config["default_device"])
-        
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
-        
-        self.stop_playback(device_id)
+    def _generic_handler(self, topic: str, message: Dict[str, Any]) -> None:
+        """
+        Gère les demandes de contrôle de la lecture.
         
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "stop"
-            })
-    
-    def _handle_next(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de passage au média suivant."""
-        device_id = message.get("device_id", self.config["default_device"])
+        Args:
+            topic: Topic sur lequel le message a été reçu
+            message: Contenu du message
+        """
+        action, control, status_field = self._actions[topic]
+        device_id = message.get("device_id") or self._default_device
         
         if not device_id:
             self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
             return
         
-        self.next_track(device_id)
+        result = control(device_id, message)
         
         # Répondre si un topic de réponse est spécifié
         reply_topic = message.get("reply_topic")
         if reply_topic:
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "next"
-            })
+            reply = self._REPLY_TEMPLATES[action].copy()
+            reply["success"] = result
+            reply["device_id"] = device_id
+            if status_field:
+                device = self.devices.get(device_id)
+                reply[status_field] = getattr(device["status"], status_field) if device else None
+            
+            self.message_bus.publish(reply_topic, reply)
     
-    def _handle_previous(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de passage au média précédent."""
-        device_id = message.get("device_id", self.config["default_device"])
-        
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
+    def _do_play(self, device_id: str, message: Dict[str, Any]) -> bool:
+        """Lit le média demandé, ou reprend la lecture si aucun n'est fourni."""
+        media_uri = message.get("uri")
         
-        self.previous_track(device_id)
+        if media_uri:
+            # Lecture d'un média spécifique
+            return self.play_media(device_id, media_uri, message.get("type"))
         
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "previous"
-            })
+        # Reprise de la lecture
+        return self.resume_playback(device_id)
     
-    def _handle_volume(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de changement de volume."""
-        device_id = message.get("device_id", self.config["default_device"])
+    def _do_volume(self, device_id: str, message: Dict[str, Any]) -> bool:
+        """Applique le volume demandé, s'il est fourni."""
         volume = message.get("volume")
         
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
-        
-        if volume is not None:
-            self.set_volume(device_id, volume)
+        if volume is None:
+            return True
         
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            device = self.devices.get(device_id, {})
-            current_volume = device.get("status", {}).get("volume", 0)
-            
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "volume",
-                "volume": current_volume
-            })
+        return self.set_volume(device_id, volume)
     
-    def _handle_mute(self, message: Dict[str, Any]) -> None:
-        """Gère les demandes de mise en sourdine."""
-        device_id = message.get("device_id", self.config["default_device"])
-        mute = message.get("mute")
-        
-        if not device_id:
-            self.logger.warning("Aucun périphérique spécifié et aucun périphérique par défaut configuré")
-            return
+    def _do_mute(self, device_id: str, message: Dict[str, Any]) -> bool:
+        """Applique la sourdine demandée, ou bascule l'état actuel."""
+        device = self._get_device_or_warn(device_id)
+        if device is None:
+            return False
         
-        if mute is not None:
-            self.set_mute(device_id, mute)
-        else:
+        mute = message.get("mute")
+        if mute is None:
             # Basculer l'état de sourdine
-            device = self.devices.get(device_id, {})
-            current_mute = device.get("status", {}).get("muted", False)
-            self.set_mute(device_id, not current_mute)
+            mute = not device["status"].muted
         
-        # Répondre si un topic de réponse est spécifié
-        reply_topic = message.get("reply_topic")
-        if reply_topic:
-            device = self.devices.get(device_id, {})
-            current_mute = device.get("status", {}).get("muted", False)
-            
-            self.message_bus.publish(reply_topic, {
-                "success": True,
-                "device_id": device_id,
-                "action": "mute",
-                "muted": current_mute
-            })
+        return self._set_mute(device_id, device, mute)
     
     def _handle_status_request(self, message: Dict[str, Any]) -> None:
         """Gère les demandes de statut."""
@@ -436,7 +571,7 @@ class MediaModule(ModuleInterface):
                 self.message_bus.publish(reply_topic, {
                     "success": True,
                     "device_id": device_id,
-                    "status": device.get("status", {})
+                    "status": device["status"].to_dict()
                 })
             else:
                 self.message_bus.publish(reply_topic, {
@@ -447,42 +582,225 @@ class MediaModule(ModuleInterface):
             # Statut de tous les périphériques
             statuses = {}
             for dev_id, device in self.devices.items():
-                statuses[dev_id] = device.get("status", {})
+                statuses[dev_id] = device["status"].to_dict()
             
             self.message_bus.publish(reply_topic, {
                 "success": True,
-                "devices": statuses
+                "devices": statuses,
+                "summary": self.get_fleet_summary()
             })
     
-    def _status_thread_func(self) -> None:
-        """Thread de surveillance de l'état des périphériques."""
-        while self.running:
-            for device_id, device in self.devices.items():
+    def _run_event_loop(self) -> None:
+        """Exécute la boucle asyncio de surveillance dans le thread dédié."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    
+    async def _create_http_session(self) -> aiohttp.ClientSession:
+        """
+        Crée la session HTTP partagée par tous les types de périphériques.
+        
+        Les connexions keep-alive du pool sont réutilisées d'une interrogation
+        à l'autre, ce qui évite une poignée de main TCP à chaque cycle.
+        """
+        connector = aiohttp.TCPConnector(limit=self.config["http_pool_size"], keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(
+            total=self.config["http_timeout"],
+            connect=self.config["http_connect_timeout"]
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+    
+    def _schedule_poll(self, delay: float) -> None:
+        """
+        Programme le prochain cycle d'interrogation dans la boucle asyncio.
+        
+        Args:
+            delay: Délai avant le cycle, en secondes
+        """
+        if self._poll_handle:
+            self._poll_handle.cancel()
+            self._poll_handle = None
+        
+        if self.running:
+            self._poll_handle = self._loop.call_later(delay, self._start_poll)
+    
+    def _start_poll(self) -> None:
+        """Lance un cycle d'interrogation, sauf si un cycle est déjà en cours."""
+        self._poll_handle = None
+        
+        # Un cycle en cours se reprogramme lui-même à la fin
+        if self._poll_task and not self._poll_task.done():
+            return
+        
+        self._poll_task = self._loop.create_task(self._poll_once())
+    
+    async def _poll_once(self) -> None:
+        """Interroge les périphériques dont l'échéance est atteinte, puis se reprogramme."""
+        try:
+            # Interroger en parallèle les périphériques dont l'échéance est atteinte
+            now = time.monotonic()
+            devices = [(device_id, device) for device_id, device in self.devices.items()
+                       if now >= device["next_poll_at"]]
+            # Génération de rafraîchissement au lancement, pour détecter les demandes pendant le cycle
+            generations = [device["refresh_generation"] for _, device in devices]
+            results = await asyncio.gather(
+                *[self._poll_device(device_id) for device_id, _ in devices],
+                return_exceptions=True
+            )
+            
+            # Écritures du gestionnaire d'état regroupées pour tout le cycle
+            pending = {}
+            
+            for (device_id, device), status, generation in zip(devices, results, generations):
+                if isinstance(status, asyncio.TimeoutError):
+                    self.logger.warning(f"Délai dépassé lors de l'interrogation du périphérique {device_id}")
+                    status = {"online": False}
+                elif isinstance(status, Exception):
+                    self.logger.error(f"Erreur lors de la mise à jour du statut du périphérique {device_id}: {str(status)}")
+                    status = {"online": False}
+                
                 try:
-                    status = self._get_device_status(device_id)
-                    
                     if status:
-                        # Mettre à jour l'état du périphérique
-                        old_status = device["status"].copy()
-                        device["status"].update(status)
-                        
-                        # Si l'état a changé, publier un événement
-                        if old_status != device["status"]:
-                            self.message_bus.publish("media/status_changed", {
-                                "device_id": device_id,
-                                "old_status": old_status,
-                                "new_status": device["status"]
-                            })
-                            
-                            # Mettre à jour le gestionnaire d'état
-                            self.state_manager.set(f"media.devices.{device_id}.status", device["status"])
+                        self._update_device_status(device_id, device, status, pending)
                 except Exception as e:
                     self.logger.error(f"Erreur lors de la mise à jour du statut du périphérique {device_id}: {str(e)}")
+                
+                self._schedule_next_poll(device, status, generation)
+            
+            if pending:
+                try:
+                    self.state_manager.set_many(pending)
+                except Exception as e:
+                    self.logger.error(f"Erreur lors de l'enregistrement de l'état des périphériques: {str(e)}")
+        finally:
+            # Se réveiller à la prochaine échéance
+            if self.devices:
+                next_poll_at = min(device["next_poll_at"] for device in self.devices.values())
+                delay = max(0.0, next_poll_at - time.monotonic())
+            else:
+                delay = self.config["polling_interval"]
+            
+            self._schedule_poll(delay)
+    
+    async def _poll_device(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Interroge un périphérique avec un délai maximal, en limitant le nombre
+        d'interrogations simultanées.
+        
+        Args:
+            device_id: Identifiant du périphérique
             
-            # Attendre avant la prochaine vérification
-            time.sleep(self.config["polling_interval"])
+        Returns:
+            État du périphérique ou None en cas d'échec
+        """
+        async with self._poll_semaphore:
+            return await asyncio.wait_for(self._get_device_status_async(device_id),
+                                          timeout=self.config["status_timeout"])
     
-    def _get_device_status(self, device_id: str) -> Optional[Dict[str, Any]]:
+    async def _stop_polling(self) -> None:
+        """Annule les cycles programmés ou en cours et ferme la session HTTP."""
+        if self._poll_handle:
+            self._poll_handle.cancel()
+            self._poll_handle = None
+        
+        if self._poll_task and not self._poll_task.done():
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+        
+        if self._http:
+            await self._http.close()
+            self._http = None
+    
+    def _schedule_next_poll(self, device: Dict[str, Any], status: Optional[Dict[str, Any]],
+                            generation: int) -> None:
+        """
+        Calcule la prochaine échéance d'interrogation d'un périphérique.
+        
+        Un périphérique injoignable voit son intervalle doubler jusqu'au plafond
+        configuré ; un périphérique en lecture est interrogé plus souvent.
+        Un rafraîchissement demandé pendant l'interrogation la fait relancer aussitôt.
+        
+        Args:
+            device: Objet du périphérique
+            status: État récupéré, ou None en cas d'échec
+            generation: Génération de rafraîchissement au lancement de l'interrogation
+        """
+        polling_interval = self.config["polling_interval"]
+        
+        if not status or not status.get("online", True):
+            device["poll_backoff"] = min(device["poll_backoff"] * 2, self.config["max_polling_interval"])
+        elif status.get("playing"):
+            device["poll_backoff"] = polling_interval / 3
+        else:
+            device["poll_backoff"] = polling_interval
+        
+        if device["refresh_generation"] != generation:
+            # L'état récupéré précède la commande : ne pas le resservir depuis le cache
+            self._status_cache.pop(device["id"], None)
+            device["next_poll_at"] = 0.0
+        else:
+            device["next_poll_at"] = time.monotonic() + device["poll_backoff"]
+    
+    def _request_status_refresh(self, device_id: Optional[str] = None) -> None:
+        """
+        Demande une interrogation immédiate des périphériques.
+        
+        Args:
+            device_id: Périphérique à interroger (tous si None)
+        """
+        if device_id in self.devices:
+            device = self.devices[device_id]
+            device["refresh_generation"] += 1
+            device["next_poll_at"] = 0.0
+            self._status_cache.pop(device_id, None)
+        elif device_id is None:
+            for device in self.devices.values():
+                device["refresh_generation"] += 1
+                device["next_poll_at"] = 0.0
+            self._status_cache.clear()
+        
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._schedule_poll, 0)
+    
+    def _update_device_status(self, device_id: str, device: Dict[str, Any], status: Dict[str, Any],
+                              pending: Dict[str, Any]) -> None:
+        """
+        Met à jour l'état d'un périphérique et publie les changements.
+        
+        Args:
+            device_id: Identifiant du périphérique
+            device: Objet du périphérique
+            status: Nouvel état récupéré
+            pending: Écritures à transmettre au gestionnaire d'état en fin de cycle
+        """
+        current = device["status"]
+        
+        # Ne retenir que les champs modifiés (cas courant : aucun)
+        changes = {key: value for key, value in status.items()
+                   if key in _STATUS_FIELDS and getattr(current, key) != value}
+        
+        # Si l'état a changé, publier un événement
+        if changes:
+            old_values = {key: getattr(current, key) for key in changes}
+            for key, value in changes.items():
+                setattr(current, key, value)
+            new_status = current.to_dict()
+            
+            self.message_bus.publish("media/status_changed", {
+                "device_id": device_id,
+                "changes": changes,
+                "old": old_values,
+                "new_status": new_status
+            })
+            
+            # Mettre à jour le gestionnaire d'état (en fin de cycle)
+            pending[f"media.devices.{device_id}.status"] = new_status
+        
+        self._status_table.set(device_id, current)
+    
+    async def _get_device_status_async(self, device_id: str) -> Optional[Dict[str, Any]]:
         """
         Récupère l'état actuel d'un périphérique.
         
@@ -492,32 +810,51 @@ class MediaModule(ModuleInterface):
         Returns:
             État du périphérique ou None en cas d'échec
         """
-        if device_id not in self.devices:
+        device = self.devices.get(device_id)
+        if device is None:
             return None
         
-        device = self.devices[device_id]
-        device_type = device["type"]
+        # Implémentation spécifique pour chaque type de périphérique
+        handler = self._STATUS_HANDLERS.get(device["type"])
+        if handler is None:
+            return None
         
         try:
-            # Implémentation spécifique pour chaque type de périphérique
-            if device_type == "tv":
-                return self._get_tv_status(device)
-            elif device_type == "speaker":
-                return self._get_speaker_status(device)
-            elif device_type == "media_player":
-                return self._get_media_player_status(device)
-            elif device_type == "cast":
-                return self._get_cast_status(device)
-            elif device_type == "kodi":
-                return self._get_kodi_status(device)
-            else:
-                return None
+            if asyncio.iscoroutinefunction(handler):
+                return await handler(self, device)
+            
+            # Les récupérations synchrones ne doivent pas bloquer la boucle
+            return await self._loop.run_in_executor(self._poll_pool, handler, self, device)
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération de l'état du périphérique {device_id}: {str(e)}")
             return None
     
+    def get_fleet_summary(self) -> Dict[str, Any]:
+        """
+        Agrège l'état de l'ensemble des périphériques.
+        
+        Returns:
+            Nombre de périphériques en ligne, en lecture, en sourdine et volume moyen
+        """
+        return self._status_table.summary()
+    
     # Méthodes de contrôle de la lecture
     
+    def _get_device_or_warn(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère un périphérique en signalant les identifiants inconnus.
+        
+        Args:
+            device_id: Identifiant du périphérique
+            
+        Returns:
+            Objet du périphérique ou None s'il est inconnu
+        """
+        device = self.devices.get(device_id)
+        if device is None:
+            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        return device
+    
     def play_media(self, device_id: str, media_uri: str, media_type: Optional[str] = None) -> bool:
         """
         Démarre la lecture d'un média sur un périphérique.
@@ -530,11 +867,9 @@ class MediaModule(ModuleInterface):
         Returns:
             True si la lecture a démarré, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
-        
-        device = self.devices[device_id]
         device_type = device["type"]
         
         try:
@@ -559,8 +894,8 @@ class MediaModule(ModuleInterface):
                 return False
             
             # Mettre à jour l'état du périphérique
-            device["status"]["playing"] = True
-            device["status"]["current_media"] = {
+            device["status"].playing = True
+            device["status"].current_media = {
                 "uri": media_uri,
                 "type": media_type or "unknown",
                 "title": os.path.basename(media_uri) if media_uri else "Unknown"
@@ -580,6 +915,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Lecture démarrée sur {device_id}: {media_uri}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors du démarrage de la lecture sur {device_id}: {str(e)}")
@@ -595,15 +931,13 @@ class MediaModule(ModuleInterface):
         Returns:
             True si la lecture a repris, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
-        
         try:
             # Mettre à jour l'état du périphérique
-            device["status"]["playing"] = True
+            device["status"].playing = True
             
             # Publier un événement
             self.message_bus.publish("media/playback_resumed", {
@@ -611,6 +945,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Lecture reprise sur {device_id}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de la reprise de la lecture sur {device_id}: {str(e)}")
@@ -626,15 +961,13 @@ class MediaModule(ModuleInterface):
         Returns:
             True si la lecture a été mise en pause, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
-        
         try:
             # Mettre à jour l'état du périphérique
-            device["status"]["playing"] = False
+            device["status"].playing = False
             
             # Publier un événement
             self.message_bus.publish("media/playback_paused", {
@@ -642,6 +975,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Lecture mise en pause sur {device_id}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise en pause sur {device_id}: {str(e)}")
@@ -657,16 +991,14 @@ class MediaModule(ModuleInterface):
         Returns:
             True si la lecture a été arrêtée, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
-        
         try:
             # Mettre à jour l'état du périphérique
-            device["status"]["playing"] = False
-            device["status"]["current_media"] = None
+            device["status"].playing = False
+            device["status"].current_media = None
             
             # Retirer des périphériques actifs
             if device_id in self.active_devices:
@@ -678,6 +1010,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Lecture arrêtée sur {device_id}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de l'arrêt de la lecture sur {device_id}: {str(e)}")
@@ -693,8 +1026,7 @@ class MediaModule(ModuleInterface):
         Returns:
             True si le passage au média suivant a réussi, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        if self._get_device_or_warn(device_id) is None:
             return False
         
         try:
@@ -719,8 +1051,7 @@ class MediaModule(ModuleInterface):
         Returns:
             True si le passage au média précédent a réussi, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        if self._get_device_or_warn(device_id) is None:
             return False
         
         try:
@@ -746,18 +1077,16 @@ class MediaModule(ModuleInterface):
         Returns:
             True si le volume a été défini, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
-        
         try:
             # Limiter le volume entre 0 et 100
             volume = max(0, min(100, volume))
             
             # Mettre à jour l'état du périphérique
-            device["status"]["volume"] = volume
+            device["status"].volume = volume
             
             # Publier un événement
             self.message_bus.publish("media/volume_changed", {
@@ -766,6 +1095,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Volume défini à {volume} sur {device_id}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de la définition du volume sur {device_id}: {str(e)}")
@@ -782,15 +1112,17 @@ class MediaModule(ModuleInterface):
         Returns:
             True si la sourdine a été définie, False sinon
         """
-        if device_id not in self.devices:
-            self.logger.warning(f"Périphérique inconnu: {device_id}")
+        device = self._get_device_or_warn(device_id)
+        if device is None:
             return False
         
-        device = self.devices[device_id]
-        
+        return self._set_mute(device_id, device, mute)
+    
+    def _set_mute(self, device_id: str, device: Dict[str, Any], mute: bool) -> bool:
+        """Applique la sourdine à un périphérique déjà résolu."""
         try:
             # Mettre à jour l'état du périphérique
-            device["status"]["muted"] = mute
+            device["status"].muted = mute
             
             # Publier un événement
             self.message_bus.publish("media/mute_changed", {
@@ -799,6 +1131,7 @@ class MediaModule(ModuleInterface):
             })
             
             self.logger.info(f"Sourdine {'activée' if mute else 'désactivée'} sur {device_id}")
+            self._request_status_refresh(device_id)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de la définition de la sourdine sur {device_id}: {str(e)}")
@@ -818,35 +1151,36 @@ class MediaModule(ModuleInterface):
             "channel": "N/A"
         }
     
-    def _get_speaker_status(self, device: Dict[str, Any]) -> Dict[str, Any]:
+    @stale_while_refresh
+    def _get_speaker_status(self, device: Dict[str, Any]) -> Mapping[str, Any]:
         """Récupère l'état d'un système audio."""
-        return {
-            "online": True,
-            "playing": False,
-            "volume": 40,
-            "muted": False
-        }
+        return _SPEAKER_DEFAULT
     
+    @ttl_cache
     def _get_media_player_status(self, device: Dict[str, Any]) -> Dict[str, Any]:
         """Récupère l'état d'un lecteur multimédia."""
+        current = device["status"]
         return {
             "online": True,
-            "playing": device["status"].get("playing", False),
-            "volume": device["status"].get("volume", 50),
+            "playing": current.playing,
+            "volume": current.volume,
             "muted": False,
-            "current_media": device["status"].get("current_media"),
-            "position": device["status"].get("position", 0),
-            "duration": device["status"].get("duration", 0)
+            "current_media": current.current_media,
+            "position": current.position,
+            "duration": current.duration
         }
     
-    def _get_cast_status(self, device: Dict[str, Any]) -> Dict[str, Any]:
+    @stale_while_refresh
+    def _get_cast_status(self, device: Dict[str, Any]) -> Mapping[str, Any]:
         """Récupère l'état d'un appareil Cast."""
         # Dans une implémentation réelle, on utiliserait pychromecast
-        return {
-            "online": True,
-            "playing": False,
-            "volume": 30,
-            "muted": False,
-            "current_app": "Netflix",
-            "current_media": None
-        }
\ No newline at end of file
+        return _CAST_DEFAULT
+    
+    # Récupération de l'état par type de périphérique (synchrone ou coroutine)
+    _STATUS_HANDLERS = {
+        "tv": _get_tv_status,
+        "speaker": _get_speaker_status,
+        "media_player": _get_media_player_status,
+        "cast": _get_cast_status,
+        "kodi": _get_kodi_status
+    }
@@ -3,45 +3,33 @@ module_interface.py: Définit l'interface standard pour tous les modules du syst
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional
 from utils.logger import get_logger
 
-class ModuleMetadata:
-    """Métadonnées décrivant un module."""
-    
-    def __init__(self, 
-                 name: str, 
-                 version: str, 
-                 description: str, 
-                 author: str,
-                 dependencies: List[str] = None,
-                 provides: List[str] = None):
-        self.name = name
-        self.version = version
-        self.description = description
-        self.author = author
-        self.dependencies = dependencies or []
-        self.provides = provides or []
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convertit les métadonnées en dictionnaire."""
-        return {
-            "name": self.name,
-            "version": self.version,
-            "description": self.description,
-            "author": self.author,
-            "dependencies": self.dependencies,
-            "provides": self.provides
-        }
+# Les métadonnées sont définies dans module_interface.py
+from modules.module_interface import ModuleMetadata
 
 class ModuleInterface(ABC):
     """Interface abstraite pour tous les modules du système."""
     
+    # Les sous-classes qui déclarent leurs propres __slots__ n'ont pas de __dict__
+    __slots__ = ("_logger", "config", "is_initialized")
+    
     def __init__(self, config: Dict[str, Any] = None):
-        self.logger = get_logger(self.__class__.__name__)
+        self._logger = None
         self.config = config or {}
         self.is_initialized = False
-        self.logger.info(f"Module {self.get_metadata().name} v{self.get_metadata().version} instancié")
+    
+    @property
+    def logger(self):
+        """Logger du module, créé à la première utilisation."""
+        if self._logger is None:
+            self._logger = get_logger(self.__class__.__name__)
+        return self._logger
+    
+    @logger.setter
+    def logger(self, value) -> None:
+        self._logger = value
     
     @classmethod
     @abstractmethod
@@ -52,4 +40,6 @@ class ModuleInterface(ABC):
     @abstractmethod
     def initialize(self) -> bool:
         """Initialise le module avec ses ressources nécessaires."""
+        metadata = self.get_metadata()
+        self.logger.info("Module %s v%s instancié", metadata.name, metadata.version)
         self.is_initialized = True
\ No newline at end of file
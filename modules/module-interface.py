@@ -6,12 +6,122 @@ pour être utilisables par les agents dans le système Alfred.
 """
 
 import abc
-from typing import Dict, Any, Optional, List, Union
+import operator
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from typing import (Dict, Any, Optional, List, Union, Callable, Tuple, FrozenSet, ClassVar,
+                    Protocol, runtime_checkable)
 
 from utils.logger import get_logger
 
 logger = get_logger("modules.interface")
 
+class LazyDict(dict):
+    """
+    Dictionnaire dont certaines valeurs ne sont calculées qu'à leur première lecture.
+    
+    Une lecture par clé ne calcule que la valeur demandée ; toute vue complète
+    (itération, len, items, comparaison, dict(), json.dumps...) calcule d'abord
+    les valeurs différées restantes.
+    """
+    
+    def __init__(self, values: Dict[str, Any], lazy: Dict[str, Callable[[], Any]]):
+        """
+        Args:
+            values: Valeurs disponibles immédiatement
+            lazy: Fonctions calculant les valeurs différées, par clé
+        """
+        super().__init__(values)
+        self._lazy = dict(lazy)
+    
+    def __missing__(self, key: str) -> Any:
+        factory = self._lazy.pop(key, None)
+        if factory is None:
+            raise KeyError(key)
+        value = self[key] = factory()
+        return value
+    
+    def _resolve_all(self) -> None:
+        """Calcule les valeurs différées qui ne l'ont pas encore été."""
+        while self._lazy:
+            self[next(iter(self._lazy))]
+    
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self._lazy
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def __iter__(self):
+        self._resolve_all()
+        return super().__iter__()
+    
+    def __len__(self) -> int:
+        return super().__len__() + len(self._lazy)
+    
+    def __eq__(self, other: object) -> bool:
+        self._resolve_all()
+        if isinstance(other, LazyDict):
+            other._resolve_all()
+        return super().__eq__(other)
+    
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return super().__repr__()
+    
+    def keys(self):
+        self._resolve_all()
+        return super().keys()
+    
+    def items(self):
+        self._resolve_all()
+        return super().items()
+    
+    def values(self):
+        self._resolve_all()
+        return super().values()
+    
+    def copy(self) -> Dict[str, Any]:
+        return self.resolve()
+    
+    def resolve(self) -> Dict[str, Any]:
+        """
+        Calcule toutes les valeurs différées.
+        
+        Returns:
+            Dictionnaire ordinaire contenant toutes les valeurs
+        """
+        self._resolve_all()
+        return dict(super().items())
+
+@runtime_checkable
+class ModuleProtocol(Protocol):
+    """
+    Contrat structurel d'un module fonctionnel.
+    
+    Permet de vérifier un module par isinstance() sans qu'il hérite de
+    ModuleInterface ; l'ABC reste la base à utiliser pour bénéficier des
+    implémentations par défaut et du contrôle des méthodes abstraites.
+    """
+    
+    module_id: str
+    
+    def initialize(self) -> bool: ...
+    
+    def get_capabilities(self) -> Dict[str, Any]: ...
+    
+    def cleanup(self) -> bool: ...
+
+
+# État renvoyé par get_status() pour un module non initialisé
+# (capacités ajoutées à chaque appel : un dictionnaire propre à l'appelant)
+_UNINITIALIZED_STATUS = {"initialized": False, "dependencies": ()}
+
 class ModuleInterface(abc.ABC):
     """
     Interface de base pour tous les modules fonctionnels.
@@ -21,6 +131,9 @@ class ModuleInterface(abc.ABC):
     aux appels de méthodes.
     """
     
+    # Les sous-classes qui déclarent leurs propres __slots__ n'ont pas de __dict__
+    __slots__ = ("module_id", "config", "_logger", "initialized")
+    
     def __init__(self, module_id: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialise un module
@@ -31,9 +144,25 @@ class ModuleInterface(abc.ABC):
         """
         self.module_id = module_id
         self.config = config or {}
-        self.logger = get_logger(f"modules.{self.module_id}")
+        self._logger = None
         self.initialized = False
     
+    @property
+    def logger(self):
+        """
+        Logger du module, créé à la première utilisation
+        
+        Returns:
+            Logger nommé d'après l'identifiant du module
+        """
+        if self._logger is None:
+            self._logger = get_logger(f"modules.{self.module_id}")
+        return self._logger
+    
+    @logger.setter
+    def logger(self, value) -> None:
+        self._logger = value
+    
     @abc.abstractmethod
     def initialize(self) -> bool:
         """
@@ -87,15 +216,22 @@ class ModuleInterface(abc.ABC):
         """
         Renvoie l'état actuel du module
         
+        Les capacités ne sont calculées que si elles sont lues.
+        
         Returns:
             Dictionnaire contenant des informations sur l'état du module
         """
-        return {
+        # Module non initialisé : ni capacités ni dépendances à calculer
+        if not self.initialized:
+            return LazyDict({"module_id": self.module_id, **_UNINITIALIZED_STATUS, "capabilities": {}}, {})
+        
+        return LazyDict({
             "module_id": self.module_id,
-            "initialized": self.initialized,
-            "capabilities": self.get_capabilities() if self.initialized else {},
+            "initialized": True,
             "dependencies": self.get_dependencies()
-        }
+        }, {
+            "capabilities": self.get_capabilities
+        })
 
 
 def create_module(module_id: str, config: Optional[Dict[str, Any]] = None) -> ModuleInterface:
@@ -117,6 +253,23 @@ def create_module(module_id: str, config: Optional[Dict[str, Any]] = None) -> Mo
     raise NotImplementedError("Cette fonction doit être implémentée par le module concret")
 
 
+def _try_create_module(module_id: str, config: Optional[Dict[str, Any]] = None) -> Tuple[bool, Union[ModuleInterface, str]]:
+    """
+    Crée une instance de module sans propager les échecs attendus
+    
+    Args:
+        module_id: Identifiant unique du module
+        config: Configuration spécifique au module
+        
+    Returns:
+        Tuple (succès, instance de module ou message d'erreur)
+    """
+    try:
+        return True, create_module(module_id, config)
+    except (NotImplementedError, ImportError) as e:
+        return False, str(e)
+
+
 def initialize_module(module_id: str, config: Optional[Dict[str, Any]] = None) -> Union[ModuleInterface, None]:
     """
     Initialise un module
@@ -132,21 +285,31 @@ def initialize_module(module_id: str, config: Optional[Dict[str, Any]] = None) -
     """
     logger = get_logger("modules.loader")
     
+    # Crée l'instance de module (échecs attendus sans trace, les autres avec)
     try:
-        # Crée l'instance de module
-        module = create_module(module_id, config)
-        
-        # Initialise le module
-        if module.initialize():
-            logger.info(f"Module {module_id} initialisé avec succès")
-            return module
-        else:
-            logger.error(f"Échec de l'initialisation du module {module_id}")
-            return None
-            
+        ok, result = _try_create_module(module_id, config)
+    except Exception as e:
+        logger.error(f"Erreur lors de la création du module {module_id}: {str(e)}", exc_info=True)
+        return None
+    if not ok:
+        logger.error(f"Impossible de créer le module {module_id}: {result}")
+        return None
+    
+    module = result
+    
+    # Initialise le module (la trace complète est réservée aux erreurs inattendues)
+    try:
+        initialized = module.initialize()
     except Exception as e:
         logger.error(f"Erreur lors de l'initialisation du module {module_id}: {str(e)}", exc_info=True)
         return None
+    
+    if initialized:
+        logger.info(f"Module {module_id} initialisé avec succès")
+        return module
+    
+    logger.error(f"Échec de l'initialisation du module {module_id}")
+    return None
 
 
 def cleanup_module(module_instance: ModuleInterface) -> bool:
@@ -163,16 +326,625 @@ def cleanup_module(module_instance: ModuleInterface) -> bool:
     """
     logger = get_logger("modules.loader")
     
-    try:
-        if module_instance and hasattr(module_instance, 'cleanup'):
-            module_id = getattr(module_instance, 'module_id', 'unknown_module')
-            if module_instance.cleanup():
-                logger.info(f"Module {module_id} nettoyé avec succès")
-                return True
-            else:
-                logger.error(f"Échec du nettoyage du module {module_id}")
-                return False
+    if not module_instance or not hasattr(module_instance, 'cleanup'):
         return True
+    
+    module_id = getattr(module_instance, 'module_id', 'unknown_module')
+    
+    try:
+        cleaned = module_instance.cleanup()
     except Exception as e:
         logger.error(f"Erreur lors du nettoyage du module: {str(e)}", exc_info=True)
         return False
+    
+    if cleaned:
+        logger.info(f"Module {module_id} nettoyé avec succès")
+        return True
+    
+    logger.error(f"Échec du nettoyage du module {module_id}")
+    return False
+
+
+@dataclass(slots=True, frozen=True)
+class ModuleMetadata:
+    """Métadonnées décrivant un module."""
+    
+    name: str
+    version: str
+    description: str
+    author: str
+    dependencies: Tuple[str, ...] = ()
+    provides: Tuple[str, ...] = ()
+    
+    def __post_init__(self) -> None:
+        # Instance figée : les valeurs normalisées sont posées directement
+        # (listes et None restent acceptés pour compatibilité)
+        if type(self.dependencies) is not tuple:
+            object.__setattr__(self, "dependencies", tuple(self.dependencies or ()))
+        if type(self.provides) is not tuple:
+            object.__setattr__(self, "provides", tuple(self.provides or ()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les métadonnées en dictionnaire."""
+        return dict(zip(_METADATA_FIELDS, _get_metadata_fields(self)))
+
+_METADATA_FIELDS = ("name", "version", "description", "author", "dependencies", "provides")
+_get_metadata_fields = operator.attrgetter(*_METADATA_FIELDS)
+
+
+def _caps(*names: str) -> Tuple[str, ...]:
+    """
+    Construit un tuple de capacités à partir de chaînes internées, partagées
+    par tous les modules qui déclarent la même capacité.
+    
+    Args:
+        names: Noms des capacités
+        
+    Returns:
+        Tuple des capacités internées
+    """
+    return tuple(sys.intern(name) for name in names)
+
+@runtime_checkable
+class BaseModuleProtocol(Protocol):
+    """
+    Contrat structurel d'un module Alfred.
+    
+    Permet de vérifier un module par isinstance() sans qu'il hérite de
+    BaseModule ; l'ABC reste la base pour les capacités déclarées par classe.
+    """
+    
+    @property
+    def name(self) -> str: ...
+    
+    def initialize(self) -> bool: ...
+    
+    def shutdown(self) -> bool: ...
+    
+    def get_capabilities(self) -> Tuple[str, ...]: ...
+
+
+class BaseModule(abc.ABC):
+    """Interface de base pour tous les modules Alfred."""
+    
+    # Capacités déclarées par la classe, partagées par toutes ses instances
+    CAPABILITIES: ClassVar[Tuple[str, ...]] = ()
+    # Ensemble précalculé pour les tests d'appartenance (voir has_capability)
+    CAPABILITY_SET: ClassVar[FrozenSet[str]] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "CAPABILITIES" in cls.__dict__:
+            cls.CAPABILITY_SET = frozenset(cls.CAPABILITIES)
+    
+    @property
+    @abc.abstractmethod
+    def name(self) -> str:
+        """Nom unique du module."""
+        pass
+    
+    @property
+    def version(self) -> str:
+        """Version du module."""
+        return "1.0.0"
+    
+    @cached_property
+    def dependencies(self) -> Tuple[str, ...]:
+        """Noms des modules dont dépend ce module (calculés une fois par instance)."""
+        return ()
+    
+    @abc.abstractmethod
+    def initialize(self) -> bool:
+        """
+        Initialise le module.
+        
+        Returns:
+            True si l'initialisation réussit, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def shutdown(self) -> bool:
+        """
+        Arrête proprement le module.
+        
+        Returns:
+            True si l'arrêt réussit, False sinon
+        """
+        pass
+    
+    @cached_property
+    def capabilities(self) -> Tuple[str, ...]:
+        """Capacités offertes par le module (calculées une fois par instance)."""
+        return self.CAPABILITIES
+    
+    def get_capabilities(self) -> Tuple[str, ...]:
+        """
+        Retourne les capacités offertes par le module.
+        
+        Returns:
+            Tuple des capacités
+        """
+        return self.capabilities
+    
+    def has_capability(self, capability: str) -> bool:
+        """
+        Vérifie si la classe du module déclare une capacité.
+        
+        Args:
+            capability: Nom de la capacité
+            
+        Returns:
+            True si la capacité est déclarée, False sinon
+        """
+        return capability in self.CAPABILITY_SET
+
+class WeatherModule(BaseModule):
+    """Interface pour les modules météo."""
+    
+    CAPABILITIES = _caps("weather_current", "weather_forecast", "rain_forecast")
+    
+    @abc.abstractmethod
+    def get_current_weather(self, location: str) -> Dict[str, Any]:
+        """
+        Récupère les conditions météo actuelles pour une localisation donnée.
+        
+        Args:
+            location: Localisation (ville, coordonnées, etc.)
+            
+        Returns:
+            Dictionnaire contenant les infos météo
+        """
+        pass
+    
+    @abc.abstractmethod
+    def get_forecast(self, location: str, days: int = 5) -> List[Dict[str, Any]]:
+        """
+        Récupère les prévisions météo pour une localisation donnée.
+        
+        Args:
+            location: Localisation (ville, coordonnées, etc.)
+            days: Nombre de jours de prévision
+            
+        Returns:
+            Liste de dictionnaires contenant les prévisions
+        """
+        pass
+    
+    def check_rain_forecast(self, location: str, hours: int = 24) -> bool:
+        """
+        Vérifie s'il va pleuvoir dans les prochaines heures.
+        
+        Args:
+            location: Localisation (ville, coordonnées, etc.)
+            hours: Nombre d'heures à vérifier
+            
+        Returns:
+            True s'il va pleuvoir, False sinon
+        """
+        # Implémentation par défaut : une seule prévision couvrant la fenêtre demandée
+        forecast = self.get_forecast(location, days=max(1, hours // 24 + 1))
+        return any((entry.get("precipitation") or 0) > 0 for entry in forecast or [])
+
+class IrrigationModule(BaseModule):
+    """Interface pour les modules d'irrigation."""
+    
+    CAPABILITIES = _caps("irrigation_control", "irrigation_scheduling")
+    
+    @abc.abstractmethod
+    def start_irrigation(self, zone: str, duration: int) -> bool:
+        """
+        Démarre l'irrigation d'une zone pour une durée donnée.
+        
+        Args:
+            zone: Nom de la zone à irriguer
+            duration: Durée d'irrigation en secondes
+            
+        Returns:
+            True si l'irrigation a démarré, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def stop_irrigation(self, zone: str) -> bool:
+        """
+        Arrête l'irrigation d'une zone.
+        
+        Args:
+            zone: Nom de la zone à arrêter
+            
+        Returns:
+            True si l'irrigation a été arrêtée, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def get_irrigation_status(self, zone: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Récupère le statut actuel de l'irrigation.
+        
+        Args:
+            zone: Nom de la zone à vérifier (toutes les zones si None)
+            
+        Returns:
+            Dictionnaire contenant le statut
+        """
+        pass
+    
+    @abc.abstractmethod
+    def schedule_irrigation(self, zone: str, time: str, duration: int, 
+                          days: List[str], weather_adjustment: bool = True) -> bool:
+        """
+        Planifie une irrigation régulière.
+        
+        Args:
+            zone: Nom de la zone
+            time: Heure au format HH:MM
+            duration: Durée en secondes
+            days: Jours de la semaine (Mo, Tu, We, Th, Fr, Sa, Su)
+            weather_adjustment: Ajuster en fonction de la météo
+            
+        Returns:
+            True si la planification a réussi, False sinon
+        """
+        pass
+
+class EnergyModule(BaseModule):
+    """Interface pour les modules d'énergie."""
+    
+    CAPABILITIES = _caps("energy_monitoring", "consumption_reporting", "optimization")
+    
+    @abc.abstractmethod
+    def log_consumption(self, device: str, consumption: float, unit: str = "kWh") -> bool:
+        """
+        Enregistre la consommation d'un appareil.
+        
+        Args:
+            device: Nom de l'appareil
+            consumption: Consommation
+            unit: Unité de mesure
+            
+        Returns:
+            True si l'enregistrement a réussi, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def get_device_consumption(self, device: str, period: str = "day") -> Dict[str, Any]:
+        """
+        Récupère la consommation d'un appareil pour une période donnée.
+        
+        Args:
+            device: Nom de l'appareil
+            period: Période (day, week, month, year)
+            
+        Returns:
+            Dictionnaire contenant la consommation
+        """
+        pass
+    
+    @abc.abstractmethod
+    def get_consumption_report(self, period: str = "day", devices: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Génère un rapport de consommation.
+        
+        Args:
+            period: Période (day, week, month, year)
+            devices: Liste des appareils à inclure (tous si None)
+            
+        Returns:
+            Dictionnaire contenant le rapport
+        """
+        pass
+    
+    @abc.abstractmethod
+    def optimize_consumption(self) -> Dict[str, Any]:
+        """
+        Propose des optimisations de consommation.
+        
+        Returns:
+            Dictionnaire contenant les recommandations
+        """
+        pass
+
+class HabitModule(BaseModule):
+    """Interface pour les modules d'analyse d'habitudes."""
+    
+    CAPABILITIES = _caps("habit_tracking", "pattern_detection", "activity_prediction")
+    
+    @abc.abstractmethod
+    def log_activity(self, category: str, timestamp: Optional[str] = None) -> bool:
+        """
+        Enregistre une activité dans une catégorie.
+        
+        Args:
+            category: Catégorie de l'activité
+            timestamp: Horodatage (moment actuel si None)
+            
+        Returns:
+            True si l'enregistrement a réussi, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def detect_patterns(self, category: Optional[str] = None, days: int = 30) -> Dict[str, Any]:
+        """
+        Détecte des modèles d'activité.
+        
+        Args:
+            category: Catégorie à analyser (toutes si None)
+            days: Nombre de jours d'historique à analyser
+            
+        Returns:
+            Dictionnaire contenant les modèles détectés
+        """
+        pass
+    
+    @abc.abstractmethod
+    def predict_next_activity(self, category: str) -> Dict[str, Any]:
+        """
+        Prédit la prochaine occurrence d'une activité.
+        
+        Args:
+            category: Catégorie de l'activité
+            
+        Returns:
+            Dictionnaire contenant la prédiction
+        """
+        pass
+
+class CommandModule(BaseModule):
+    """Interface pour les modules d'exécution de commandes."""
+    
+    CAPABILITIES = _caps("command_execution", "script_execution")
+    
+    @abc.abstractmethod
+    def execute_command(self, command: str, working_dir: Optional[str] = None, 
+                       timeout: Optional[int] = None, shell: bool = True) -> Tuple[str, str, int]:
+        """
+        Exécute une commande système.
+        
+        Args:
+            command: Commande à exécuter
+            working_dir: Répertoire de travail
+            timeout: Timeout en secondes
+            shell: Utiliser un shell pour l'exécution
+            
+        Returns:
+            Tuple (stdout, stderr, code de retour)
+        """
+        pass
+    
+    @abc.abstractmethod
+    def execute_script(self, script_content: str, script_type: str, 
+                      script_name: Optional[str] = None, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exécute un script.
+        
+        Args:
+            script_content: Contenu du script
+            script_type: Type de script (autohotkey, python, batch, etc.)
+            script_name: Nom du fichier script (généré si None)
+            timeout: Timeout en secondes
+            
+        Returns:
+            Dictionnaire contenant le résultat
+        """
+        pass
+
+class SecurityModule(BaseModule):
+    """Interface pour les modules de sécurité."""
+    
+    CAPABILITIES = _caps("intrusion_detection", "log_analysis", "network_monitoring")
+    
+    @abc.abstractmethod
+    def check_intrusions(self) -> List[Dict[str, Any]]:
+        """
+        Vérifie les intrusions.
+        
+        Returns:
+            Liste des intrusions détectées
+        """
+        pass
+    
+    @abc.abstractmethod
+    def check_logs(self, log_file: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Vérifie les logs à la recherche d'anomalies.
+        
+        Args:
+            log_file: Fichier log à vérifier (tous si None)
+            
+        Returns:
+            Dictionnaire contenant les anomalies détectées
+        """
+        pass
+    
+    @abc.abstractmethod
+    def check_network(self) -> Dict[str, Any]:
+        """
+        Vérifie le réseau à la recherche d'anomalies.
+        
+        Returns:
+            Dictionnaire contenant les anomalies détectées
+        """
+        pass
+
+class TranslationModule(BaseModule):
+    """Interface pour les modules de traduction."""
+    
+    CAPABILITIES = _caps("language_detection", "text_translation", "file_translation")
+    
+    @abc.abstractmethod
+    def detect_language(self, text: str) -> Dict[str, Any]:
+        """
+        Détecte la langue d'un texte.
+        
+        Args:
+            text: Texte à analyser
+            
+        Returns:
+            Dictionnaire contenant la langue détectée et la confiance
+        """
+        pass
+    
+    @abc.abstractmethod
+    def translate_text(self, text: str, target_lang: str, source_lang: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Traduit un texte.
+        
+        Args:
+            text: Texte à traduire
+            target_lang: Langue cible
+            source_lang: Langue source (automatique si None)
+            
+        Returns:
+            Dictionnaire contenant la traduction
+        """
+        pass
+    
+    @abc.abstractmethod
+    def translate_file(self, file_path: str, target_lang: str, source_lang: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Traduit un fichier.
+        
+        Args:
+            file_path: Chemin du fichier
+            target_lang: Langue cible
+            source_lang: Langue source (automatique si None)
+            
+        Returns:
+            Dictionnaire contenant le chemin du fichier traduit
+        """
+        pass
+
+class EmotionModule(BaseModule):
+    """Interface pour les modules d'analyse d'émotions."""
+    
+    CAPABILITIES = _caps("emotion_detection", "emotional_tts")
+    
+    @abc.abstractmethod
+    def analyze_emotion(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Analyse l'émotion dans un fichier audio.
+        
+        Args:
+            audio_path: Chemin du fichier audio
+            
+        Returns:
+            Dictionnaire contenant l'émotion détectée et la confiance
+        """
+        pass
+    
+    @abc.abstractmethod
+    def text_to_speech(self, text: str, emotion: str = "neutre") -> str:
+        """
+        Convertit du texte en parole avec une émotion donnée.
+        
+        Args:
+            text: Texte à convertir
+            emotion: Émotion à appliquer
+            
+        Returns:
+            Chemin du fichier audio généré
+        """
+        pass
+
+class NLPModule(BaseModule):
+    """Interface pour les modules de traitement du langage naturel."""
+    
+    CAPABILITIES = _caps("sentiment_analysis", "entity_extraction", "response_generation")
+    
+    @abc.abstractmethod
+    def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """
+        Analyse le sentiment d'un texte.
+        
+        Args:
+            text: Texte à analyser
+            
+        Returns:
+            Dictionnaire contenant le sentiment détecté
+        """
+        pass
+    
+    @abc.abstractmethod
+    def extract_entities(self, text: str) -> Dict[str, Any]:
+        """
+        Extrait les entités d'un texte.
+        
+        Args:
+            text: Texte à analyser
+            
+        Returns:
+            Dictionnaire contenant les entités extraites
+        """
+        pass
+    
+    @abc.abstractmethod
+    def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Génère une réponse à un prompt.
+        
+        Args:
+            prompt: Prompt à traiter
+            context: Contexte additionnel
+            
+        Returns:
+            Réponse générée
+        """
+        pass
+
+class NotificationModule(BaseModule):
+    """Interface pour les modules de notification."""
+    
+    CAPABILITIES = _caps("notification_sending", "notification_scheduling")
+    
+    @abc.abstractmethod
+    def send_notification(self, message: str, level: str = "info", 
+                        channel: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Envoie une notification.
+        
+        Args:
+            message: Message à envoyer
+            level: Niveau de la notification (info, warning, error, etc.)
+            channel: Canal de notification (email, sms, etc.)
+            metadata: Métadonnées additionnelles
+            
+        Returns:
+            True si la notification a été envoyée, False sinon
+        """
+        pass
+    
+    @abc.abstractmethod
+    def schedule_notification(self, message: str, schedule_time: Union[str, int], 
+                           level: str = "info", channel: Optional[str] = None, 
+                           metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Planifie une notification.
+        
+        Args:
+            message: Message à envoyer
+            schedule_time: Moment de la notification (timestamp ou format ISO)
+            level: Niveau de la notification
+            channel: Canal de notification
+            metadata: Métadonnées additionnelles
+            
+        Returns:
+            ID de la notification planifiée
+        """
+        pass
+    
+    @abc.abstractmethod
+    def cancel_notification(self, notification_id: str) -> bool:
+        """
+        Annule une notification planifiée.
+        
+        Args:
+            notification_id: ID de la notification
+            
+        Returns:
+            True si la notification a été annulée, False sinon
+        """
+        pass
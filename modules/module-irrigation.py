@@ -1,11 +1,99 @@
 import logging
+import sys
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, fields
 import time
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+# Planificateur partagé pour les arrêts automatiques et les planifications (optionnel)
+try:
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.jobstores.base import JobLookupError
+    APSCHEDULER_AVAILABLE = True
+except ImportError:
+    APSCHEDULER_AVAILABLE = False
 
 from modules.base_module import BaseModule
 from modules.message_bus import MessageBus
 from modules.state_manager import StateManager
 
+# Jours de la semaine des planifications (lundi = 0, comme datetime.weekday())
+_WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+# Topics du bus, internés une fois à l'import
+_TOPIC_START = sys.intern("irrigation/start")
+_TOPIC_STOP = sys.intern("irrigation/stop")
+_TOPIC_STATUS = sys.intern("irrigation/status")
+_TOPIC_ZONE_STARTED = sys.intern("irrigation/zone_started")
+_TOPIC_ZONE_STOPPED = sys.intern("irrigation/zone_stopped")
+_TOPIC_ZONES_STOPPED_BULK = sys.intern("irrigation/zones_stopped_bulk")
+_TOPIC_RAIN_DETECTED = sys.intern("weather/rain_detected")
+_TOPIC_FORECAST_UPDATED = sys.intern("weather/forecast_updated")
+_TOPIC_SOIL_MOISTURE = sys.intern("sensor/soil_moisture")
+_WEATHER_STATE_KEY = sys.intern("weather")
+
+# Durée pendant laquelle une pluie reçue bloque l'irrigation (24h, en ns)
+_RAIN_MEMORY_NS = 24 * 3600 * 1_000_000_000
+
+@dataclass(slots=True)
+class ZoneConfig:
+    """Configuration d'une zone d'irrigation."""
+    name: str = ""  # identifiant de la zone par défaut
+    moisture_sensor: Optional[str] = None
+    default_duration: int = 15  # minutes
+    auto_irrigation: bool = False
+    
+    @classmethod
+    def from_config(cls, zone_id: str, config: Dict[str, Any]) -> "ZoneConfig":
+        """
+        Construit la configuration d'une zone depuis la configuration du module.
+        
+        Args:
+            zone_id: Identifiant de la zone
+            config: Configuration de la zone
+            
+        Returns:
+            ZoneConfig: Configuration validée
+        """
+        if not isinstance(config, dict):
+            raise ValueError(f"Configuration invalide pour la zone {zone_id}: {config!r}")
+        unknown = config.keys() - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Clés inconnues pour la zone {zone_id}: {', '.join(sorted(unknown))}")
+        return cls(**{"name": zone_id, **config})
+
+@dataclass(slots=True, frozen=True)
+class IrrigationThresholds:
+    """Seuils de décision, validés une fois à la construction du module."""
+    moisture: float = 30  # %
+    moisture_stop: float = 40  # % (arrêt automatique au-dessus de ce seuil)
+    rain: float = 5  # mm dans les dernières 24h
+    rain_forecast: float = 30  # % de probabilité de pluie
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "IrrigationThresholds":
+        """
+        Construit les seuils depuis la configuration du module.
+        
+        Args:
+            config: Configuration du module
+            
+        Returns:
+            IrrigationThresholds: Seuils validés
+        """
+        moisture = config.get("moisture_threshold", 30)
+        rain = config.get("rain_threshold", 5)
+        rain_forecast = config.get("rain_forecast_threshold", 30)
+        for key, value in (("moisture_threshold", moisture), ("rain_threshold", rain),
+                           ("rain_forecast_threshold", rain_forecast)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Seuil invalide {key}: {value!r}")
+        return cls(moisture, moisture + 10, rain, rain_forecast)
+
 class IrrigationModule(BaseModule):
     """
     Module de gestion de l'irrigation intelligente.
@@ -13,6 +101,17 @@ class IrrigationModule(BaseModule):
     de l'humidité du sol et des planifications.
     """
     
+    # Attributs d'instance propres au module (ceux de la base restent gérés par BaseModule)
+    __slots__ = (
+        "zones", "_sensor_to_zone", "_auto_zones", "_moisture_keys", "_state_key", "schedules",
+        "_compiled_schedules", "_schedule_by_day", "thresholds", "moisture_threshold",
+        "rain_threshold", "rain_forecast_threshold", "_static_status", "per_zone_stop_events",
+        "_zone_index", "_index_zone", "_active_mask", "_status_version", "_cached_version",
+        "_cached_status", "_moisture_data", "_last_moisture_decision", "_scheduler",
+        "_stop_timers", "_tick_timer", "_recent_rain", "_recent_rain_time", "_rain_forecast",
+        "state_flush_delay", "_state_dirty", "_flush_timer", "_state_lock", "_zones_lock"
+    )
+    
     def __init__(self, module_id: str, config: Dict[str, Any], message_bus: MessageBus, state_manager: StateManager):
         """
         Initialise le module d'irrigation.
@@ -26,32 +125,93 @@ class IrrigationModule(BaseModule):
         super().__init__(module_id, "irrigation", config, message_bus, state_manager)
         
         # Configuration des zones d'irrigation
-        self.zones = config.get("zones", {})
-        
-        # Configuration des planifications
+        self.zones: Dict[str, ZoneConfig] = {zone_id: ZoneConfig.from_config(zone_id, zone_config)
+                                             for zone_id, zone_config in config.get("zones", {}).items()}
+        
+        # Index précalculés (la configuration des zones ne change pas en cours d'exécution)
+        self._sensor_to_zone = {zone.moisture_sensor: zone_id for zone_id, zone in self.zones.items()
+                                if zone.moisture_sensor}
+        self._auto_zones = frozenset(zone_id for zone_id, zone in self.zones.items() if zone.auto_irrigation)
+        self._moisture_keys = {zone_id: sys.intern(f"sensor_{sensor_id}")
+                               for sensor_id, zone_id in self._sensor_to_zone.items()}
+        self._state_key = sys.intern(f"{self.module_id}_state")
+        
+        # Configuration des planifications, analysée une seule fois
         self.schedules = config.get("schedules", {})
+        self._compiled_schedules = self._compile_schedules(self.schedules)
+        self._schedule_by_day: Dict[int, List[Tuple[int, str]]] = {day: [] for day in range(7)}
+        for schedule_id, (minute_of_day, days, _, _) in self._compiled_schedules.items():
+            for day in days:
+                self._schedule_by_day[day].append((minute_of_day, schedule_id))
+        for entries in self._schedule_by_day.values():
+            entries.sort()
+        
+        # Seuils d'humidité et de pluie pour prendre des décisions (figés à la construction)
+        self.thresholds = IrrigationThresholds.from_config(config)
+        self.moisture_threshold = self.thresholds.moisture
+        self.rain_threshold = self.thresholds.rain
+        self.rain_forecast_threshold = self.thresholds.rain_forecast
+        
+        # Partie du statut fixée à la construction
+        self._static_status = MappingProxyType({
+            "zone_count": len(self.zones),
+            "moisture_threshold": self.moisture_threshold,
+            "rain_threshold": self.rain_threshold,
+            "rain_forecast_threshold": self.rain_forecast_threshold
+        })
+        
+        # Publier aussi un événement par zone lors des arrêts groupés (compatibilité)
+        self.per_zone_stop_events = config.get("per_zone_stop_events", False)
+        
+        # État interne : zones actives sous forme de masque de bits (un bit par zone configurée)
+        self._zone_index = {zone_id: i for i, zone_id in enumerate(self.zones)}
+        self._index_zone = list(self.zones)
+        self._active_mask = 0
+        
+        # Les arrêts automatiques s'exécutent hors du fil du bus (planificateur, minuteurs) :
+        # toute modification de l'état des zones passe par ce verrou
+        self._zones_lock = threading.RLock()
+        
+        # Statut mis en cache, invalidé par un compteur de version (zones actives, humidité)
+        self._status_version = 0
+        self._cached_version = -1
+        self._cached_status: Optional[Mapping[str, Any]] = None
+        self._moisture_data: Optional[Dict[str, Any]] = None
         
-        # Seuils d'humidité et de pluie pour prendre des décisions
-        self.moisture_threshold = config.get("moisture_threshold", 30)  # %
-        self.rain_threshold = config.get("rain_threshold", 5)  # mm dans les dernières 24h
-        self.rain_forecast_threshold = config.get("rain_forecast_threshold", 30)  # % de probabilité de pluie
+        # Dernière décision automatique par zone ("start", "stop" ou "idle"), pour n'agir qu'aux transitions
+        self._last_moisture_decision: Dict[str, str] = {}
         
-        # État interne
-        self._active_zones = set()
+        # Arrêts automatiques : un planificateur unique, ou un minuteur par zone à défaut
+        self._scheduler = None
+        self._stop_timers: Dict[str, threading.Timer] = {}
+        self._tick_timer: Optional[threading.Timer] = None
         
-        self.logger.info(f"Module d'irrigation initialisé avec {len(self.zones)} zones")
+        # Dernières conditions météo connues, tenues à jour par les gestionnaires de messages
+        self._recent_rain = 0.0  # mm
+        self._recent_rain_time = 0  # horloge monotone, en ns
+        self._rain_forecast = 0.0  # %
+        
+        # Sauvegarde différée de l'état (les rafales de changements sont regroupées)
+        self.state_flush_delay = config.get("state_flush_delay", 0.1)  # secondes
+        self._state_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._state_lock = threading.Lock()
+        
+        self.logger.info("Module d'irrigation initialisé avec %d zones", len(self.zones))
         
         # Enregistrement des gestionnaires de messages
         self._register_handlers()
     
     def _register_handlers(self):
         """Enregistre les gestionnaires de messages pour ce module."""
-        self.message_bus.register_handler("irrigation/start", self._handle_start_zone)
-        self.message_bus.register_handler("irrigation/stop", self._handle_stop_zone)
-        self.message_bus.register_handler("irrigation/status", self._handle_status_request)
-        self.message_bus.register_handler("weather/rain_detected", self._handle_rain_detected)
-        self.message_bus.register_handler("weather/forecast_updated", self._handle_forecast_updated)
-        self.message_bus.register_handler("sensor/soil_moisture", self._handle_soil_moisture)
+        self.message_bus.register_handlers({
+            _TOPIC_START: self._handle_start_zone,
+            _TOPIC_STOP: self._handle_stop_zone,
+            _TOPIC_STATUS: self._handle_status_request,
+            _TOPIC_RAIN_DETECTED: self._handle_rain_detected,
+            _TOPIC_FORECAST_UPDATED: self._handle_forecast_updated,
+            _TOPIC_SOIL_MOISTURE: self._handle_soil_moisture
+        })
     
     def start(self):
         """Démarre le module et initialise les planifications."""
@@ -60,6 +220,26 @@ class IrrigationModule(BaseModule):
         # Charger l'état précédent si disponible
         self._load_state()
         
+        # Démarrer le planificateur partagé
+        if APSCHEDULER_AVAILABLE:
+            self._scheduler = BackgroundScheduler()
+            self._scheduler.start()
+        else:
+            self.logger.warning("APScheduler non disponible, planifications vérifiées chaque minute")
+        
+        # Zones restaurées actives : l'arrêt automatique n'a pas pu être programmé au chargement
+        for zone_id in self._active_zones:
+            self.logger.info("Zone %s active au redémarrage, arrêt dans %d minutes",
+                             zone_id, self.zones[zone_id].default_duration)
+            self._schedule_auto_stop(zone_id, self.zones[zone_id].default_duration)
+        
+        # Initialiser les conditions météo connues (mises à jour ensuite par les événements)
+        weather_state = self.state_manager.get_state(_WEATHER_STATE_KEY)
+        if weather_state:
+            self._recent_rain = weather_state.get("recent_rain", 0)
+            self._recent_rain_time = time.monotonic_ns()
+            self._rain_forecast = weather_state.get("rain_forecast", 0)
+        
         # Initialiser les planifications
         self._setup_schedules()
         
@@ -70,45 +250,206 @@ class IrrigationModule(BaseModule):
         """Arrête le module et sauvegarde l'état actuel."""
         self.logger.info("Arrêt du module d'irrigation")
         
-        # Arrêter toutes les zones actives
-        for zone_id in list(self._active_zones):
-            self._stop_zone(zone_id)
+        # Arrêter toutes les zones actives (copie entière du masque, sans liste intermédiaire)
+        mask = self._active_mask
+        while mask:
+            index = (mask & -mask).bit_length() - 1
+            mask &= mask - 1
+            self._stop_zone(self._index_zone[index])
         
-        # Sauvegarder l'état
-        self._save_state()
+        # Arrêter le planificateur
+        if self._tick_timer is not None:
+            self._tick_timer.cancel()
+            self._tick_timer = None
+        if self._scheduler:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+        
+        # Sauvegarder l'état immédiatement
+        self._flush_state(force=True)
         
         # Définir le statut comme inactif
         self.active = False
     
     def _load_state(self):
         """Charge l'état précédent depuis le gestionnaire d'état."""
-        state = self.state_manager.get_state(f"{self.module_id}_state")
+        state = self.state_manager.get_state(self._state_key)
         if state:
             self.logger.info("Chargement de l'état précédent")
             if "active_zones" in state:
                 # Vérifier si les zones sont toujours valides dans la configuration
-                valid_zones = {zone_id for zone_id in state["active_zones"] if zone_id in self.zones}
-                self._active_zones = valid_zones
+                self._active_mask = 0
+                for zone_id in state["active_zones"]:
+                    if zone_id in self._zone_index:
+                        self._active_mask |= 1 << self._zone_index[zone_id]
+                self._status_version += 1
     
     def _save_state(self):
         """Sauvegarde l'état actuel dans le gestionnaire d'état."""
         state = {
-            "active_zones": list(self._active_zones),
+            "active_zones": self._active_zones,
             "last_update": time.time()
         }
-        self.state_manager.set_state(f"{self.module_id}_state", state)
+        self.state_manager.set_state(self._state_key, state)
+    
+    def _mark_dirty(self):
+        """Signale un changement d'état et programme une sauvegarde différée."""
+        with self._state_lock:
+            self._state_dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.state_flush_delay, self._flush_state)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_state(self, force: bool = False):
+        """
+        Sauvegarde l'état s'il a changé depuis la dernière sauvegarde.
+        
+        Args:
+            force: Annuler la sauvegarde programmée et sauvegarder immédiatement
+        """
+        with self._state_lock:
+            if self._flush_timer is not None:
+                if force:
+                    self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if not (self._state_dirty or force):
+                return
+            self._state_dirty = False
+        
+        self._save_state()
+    
+    @property
+    def _active_zones(self) -> List[str]:
+        """Liste des zones actives, dans l'ordre de la configuration."""
+        mask = self._active_mask
+        return [self._index_zone[i] for i in range(mask.bit_length()) if (mask >> i) & 1]
+    
+    def _is_active(self, zone_id: str) -> bool:
+        """Indique si une zone est active."""
+        index = self._zone_index.get(zone_id)
+        return index is not None and (self._active_mask >> index) & 1 == 1
+    
+    def _compile_schedules(self, schedules: Dict[str, Any]) -> Dict[str, Tuple[int, Tuple[int, ...], Optional[int], Tuple[str, ...]]]:
+        """
+        Analyse les planifications une fois pour toutes.
+        
+        Args:
+            schedules: Planifications de la configuration
+            
+        Returns:
+            Dictionnaire schedule_id -> (minute du jour, jours, durée, zones)
+        """
+        compiled = {}
+        for schedule_id, schedule in schedules.items():
+            try:
+                hour, minute = schedule.get("time", "00:00").split(":")
+                minute_of_day = int(hour) * 60 + int(minute)
+                days = tuple(sorted({_WEEKDAYS[day.lower()] for day in schedule.get("days", [])})) or tuple(range(7))
+            except (ValueError, KeyError, AttributeError) as e:
+                self.logger.error("Planification invalide %s: %s", schedule_id, e)
+                continue
+            if not 0 <= minute_of_day < 24 * 60:
+                self.logger.error("Planification invalide %s: heure hors limites", schedule_id)
+                continue
+            compiled[schedule_id] = (minute_of_day, days, schedule.get("duration"), tuple(schedule.get("zones", [])))
+        return compiled
     
     def _setup_schedules(self):
         """Configure les planifications d'irrigation."""
         self.logger.info("Configuration des planifications d'irrigation")
         
-        # Ici, nous pourrions ajouter des tâches planifiées
-        # Pour cet exemple, nous simulons simplement la configuration
-        for schedule_id, schedule in self.schedules.items():
-            self.logger.info(f"Planification configurée: {schedule_id}")
-            
-            # Dans une implémentation réelle, nous utiliserions un scheduler
-            # comme APScheduler pour configurer les tâches
+        if not self._scheduler:
+            # Sans planificateur, la table par jour est consultée chaque minute
+            if self._compiled_schedules:
+                self._arm_schedule_tick()
+            return
+        
+        for schedule_id, (minute_of_day, days, _, _) in self._compiled_schedules.items():
+            trigger = CronTrigger(day_of_week=",".join(map(str, days)),
+                                  hour=minute_of_day // 60, minute=minute_of_day % 60)
+            self._scheduler.add_job(self._run_schedule, trigger, args=[schedule_id],
+                                    id=f"schedule_{schedule_id}", replace_existing=True,
+                                    max_instances=1, misfire_grace_time=60)
+            self.logger.info("Planification configurée: %s", schedule_id)
+    
+    def _arm_schedule_tick(self):
+        """Programme la prochaine vérification des planifications au début de la minute suivante."""
+        delay = 60 - time.time() % 60
+        self._tick_timer = threading.Timer(delay, self._schedule_tick)
+        self._tick_timer.daemon = True
+        self._tick_timer.start()
+    
+    def _schedule_tick(self):
+        """Exécute les planifications prévues pour la minute courante."""
+        now = datetime.now()
+        minute_of_day = now.hour * 60 + now.minute
+        entries = self._schedule_by_day[now.weekday()]
+        
+        i = bisect_left(entries, (minute_of_day, ""))
+        while i < len(entries) and entries[i][0] == minute_of_day:
+            self._run_schedule(entries[i][1])
+            i += 1
+        
+        if self.active:
+            self._arm_schedule_tick()
+    
+    def _run_schedule(self, schedule_id: str):
+        """
+        Exécute une planification d'irrigation.
+        
+        Args:
+            schedule_id: Identifiant de la planification
+        """
+        compiled = self._compiled_schedules.get(schedule_id)
+        if compiled is None:
+            return
+        _, _, duration, zones = compiled
+        self.logger.info("Exécution de la planification %s", schedule_id)
+        
+        for zone_id in zones:
+            self._start_zone(zone_id, duration)
+    
+    def _schedule_auto_stop(self, zone_id: str, duration: int):
+        """
+        Programme l'arrêt automatique d'une zone.
+        
+        Args:
+            zone_id: Identifiant de la zone
+            duration: Durée d'irrigation en minutes
+        """
+        if self._scheduler:
+            self._scheduler.add_job(self._stop_zone, "date", run_date=datetime.now() + timedelta(minutes=duration),
+                                    args=[zone_id], id=f"stop_{zone_id}", replace_existing=True,
+                                    misfire_grace_time=60)
+            return
+        
+        # Sans planificateur, un minuteur par zone active
+        with self._zones_lock:
+            self._cancel_auto_stop(zone_id)
+            timer = threading.Timer(duration * 60, self._stop_zone, args=[zone_id])
+            timer.daemon = True
+            self._stop_timers[zone_id] = timer
+            timer.start()
+    
+    def _cancel_auto_stop(self, zone_id: str):
+        """
+        Annule l'arrêt automatique programmé d'une zone.
+        
+        Args:
+            zone_id: Identifiant de la zone
+        """
+        if self._scheduler:
+            try:
+                self._scheduler.remove_job(f"stop_{zone_id}")
+            except JobLookupError:
+                pass
+        
+        with self._zones_lock:
+            timer = self._stop_timers.pop(zone_id, None)
+        if timer:
+            timer.cancel()
     
     def _start_zone(self, zone_id: str, duration: int = None) -> bool:
         """
@@ -122,51 +463,50 @@ class IrrigationModule(BaseModule):
             bool: True si démarré avec succès, False sinon
         """
         if zone_id not in self.zones:
-            self.logger.warning(f"Zone {zone_id} inconnue")
+            self.logger.warning("Zone %s inconnue", zone_id)
             return False
         
-        # Vérifier si la zone est déjà active
-        if zone_id in self._active_zones:
-            self.logger.info(f"Zone {zone_id} déjà active")
-            return True
-        
-        # Vérifier les conditions météorologiques si disponibles
-        weather_state = self.state_manager.get_state("weather")
-        if weather_state:
-            recent_rain = weather_state.get("recent_rain", 0)
-            rain_forecast = weather_state.get("rain_forecast", 0)
+        # Vérification et activation atomiques (les arrêts peuvent venir d'autres fils)
+        with self._zones_lock:
+            # Vérifier si la zone est déjà active
+            if self._is_active(zone_id):
+                self.logger.info("Zone %s déjà active", zone_id)
+                return True
+            
+            # Vérifier les dernières conditions météorologiques connues
+            # (la pluie signalée n'est prise en compte que pendant 24h)
+            recent_rain = self._recent_rain if time.monotonic_ns() - self._recent_rain_time < _RAIN_MEMORY_NS else 0
             
             if recent_rain > self.rain_threshold:
-                self.logger.info(f"Irrigation annulée pour la zone {zone_id}: pluie récente ({recent_rain}mm)")
+                self.logger.info("Irrigation annulée pour la zone %s: pluie récente (%smm)", zone_id, recent_rain)
                 return False
-                
-            if rain_forecast > self.rain_forecast_threshold:
-                self.logger.info(f"Irrigation annulée pour la zone {zone_id}: prévision de pluie ({rain_forecast}%)")
+            
+            if self._rain_forecast > self.rain_forecast_threshold:
+                self.logger.info("Irrigation annulée pour la zone %s: prévision de pluie (%s%%)", zone_id, self._rain_forecast)
                 return False
-        
-        # Ajuster la durée si nécessaire
-        if duration is None:
-            duration = self.zones[zone_id].get("default_duration", 15)
-        
-        # Dans une implémentation réelle, nous enverrions des commandes aux dispositifs physiques
-        # Ici, nous simulons simplement l'activation
-        self.logger.info(f"Démarrage de l'irrigation pour la zone {zone_id} pendant {duration} minutes")
-        
-        # Ajouter à la liste des zones actives
-        self._active_zones.add(zone_id)
+            
+            # Ajuster la durée si nécessaire
+            if duration is None:
+                duration = self.zones[zone_id].default_duration
+            
+            # Dans une implémentation réelle, nous enverrions des commandes aux dispositifs physiques
+            # Ici, nous simulons simplement l'activation
+            self.logger.info("Démarrage de l'irrigation pour la zone %s pendant %s minutes", zone_id, duration)
+            
+            # Ajouter à la liste des zones actives et programmer l'arrêt automatique
+            self._active_mask |= 1 << self._zone_index[zone_id]
+            self._status_version += 1
+            self._schedule_auto_stop(zone_id, duration)
         
         # Publier un événement
-        self.message_bus.publish("irrigation/zone_started", {
+        self.message_bus.publish(_TOPIC_ZONE_STARTED, {
             "zone_id": zone_id,
             "duration": duration,
             "start_time": time.time()
         })
         
-        # Programmer l'arrêt automatique après la durée spécifiée
-        # Dans une implémentation réelle, nous utiliserions un scheduler
-        
         # Mettre à jour l'état
-        self._save_state()
+        self._mark_dirty()
         
         return True
     
@@ -181,56 +521,81 @@ class IrrigationModule(BaseModule):
             bool: True si arrêté avec succès, False sinon
         """
         if zone_id not in self.zones:
-            self.logger.warning(f"Zone {zone_id} inconnue")
+            self.logger.warning("Zone %s inconnue", zone_id)
             return False
         
         # Vérifier si la zone est active
-        if zone_id not in self._active_zones:
-            self.logger.info(f"Zone {zone_id} déjà inactive")
+        if not self._stop_zone_nopublish(zone_id):
+            self.logger.info("Zone %s déjà inactive", zone_id)
             return True
         
-        # Dans une implémentation réelle, nous enverrions des commandes aux dispositifs physiques
-        # Ici, nous simulons simplement la désactivation
-        self.logger.info(f"Arrêt de l'irrigation pour la zone {zone_id}")
-        
-        # Retirer de la liste des zones actives
-        self._active_zones.remove(zone_id)
-        
         # Publier un événement
-        self.message_bus.publish("irrigation/zone_stopped", {
+        self.message_bus.publish(_TOPIC_ZONE_STOPPED, {
             "zone_id": zone_id,
             "stop_time": time.time()
         })
         
+        return True
+    
+    def _stop_zone_nopublish(self, zone_id: str) -> bool:
+        """
+        Arrête l'irrigation d'une zone sans publier d'événement.
+        
+        Args:
+            zone_id: Identifiant de la zone
+            
+        Returns:
+            bool: True si la zone était active et a été arrêtée, False sinon
+        """
+        with self._zones_lock:
+            if not self._is_active(zone_id):
+                return False
+            
+            # Dans une implémentation réelle, nous enverrions des commandes aux dispositifs physiques
+            # Ici, nous simulons simplement la désactivation
+            self.logger.info("Arrêt de l'irrigation pour la zone %s", zone_id)
+            
+            # Retirer de la liste des zones actives
+            self._active_mask &= ~(1 << self._zone_index[zone_id])
+            self._status_version += 1
+            self._cancel_auto_stop(zone_id)
+            
+            # Oublier la dernière décision automatique : le prochain échantillon sec doit pouvoir redémarrer la zone
+            self._last_moisture_decision.pop(zone_id, None)
+        
         # Mettre à jour l'état
-        self._save_state()
+        self._mark_dirty()
         
         return True
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> Mapping[str, Any]:
         """
         Récupère le statut actuel du système d'irrigation.
         
         Returns:
-            Dict: Statut du système d'irrigation
+            Mapping: Vue en lecture seule du statut, réutilisée tant que rien n'a changé
         """
-        # Récupérer l'état d'humidité des zones si disponible
-        moisture_data = {}
-        for zone_id in self.zones:
-            sensor_id = self.zones[zone_id].get("moisture_sensor")
-            if sensor_id:
-                moisture_state = self.state_manager.get_state(f"sensor_{sensor_id}")
-                if moisture_state:
-                    moisture_data[zone_id] = moisture_state.get("value", 0)
-        
-        return {
-            "active_zones": list(self._active_zones),
-            "zone_count": len(self.zones),
-            "moisture_data": moisture_data,
-            "moisture_threshold": self.moisture_threshold,
-            "rain_threshold": self.rain_threshold,
-            "rain_forecast_threshold": self.rain_forecast_threshold
-        }
+        with self._zones_lock:
+            return self._build_status()
+    
+    def _build_status(self) -> Mapping[str, Any]:
+        """Construit (ou réutilise) la vue du statut ; appelé sous le verrou des zones."""
+        if self._cached_status is not None and self._cached_version == self._status_version:
+            return self._cached_status
+        
+        # Humidité des zones lue une seule fois (lecture groupée), puis tenue à jour par les événements
+        if self._moisture_data is None:
+            states = self.state_manager.get_many(list(self._moisture_keys.values()))
+            self._moisture_data = {zone_id: states[key].get("value", 0)
+                                   for zone_id, key in self._moisture_keys.items() if states.get(key)}
+        
+        self._cached_status = MappingProxyType({
+            "active_zones": tuple(self._active_zones),
+            "moisture_data": MappingProxyType(dict(self._moisture_data)),
+            **self._static_status
+        })
+        self._cached_version = self._status_version
+        return self._cached_status
     
     # Gestionnaires de messages
     
@@ -273,32 +638,62 @@ class IrrigationModule(BaseModule):
     
     def _handle_status_request(self, message: Dict[str, Any]):
         """Gère les demandes de statut."""
-        status = self.get_status()
-        
-        # Répondre avec le statut
+        # Répondre avec le statut (copie sérialisable de la vue en cache)
         if "reply_topic" in message:
-            self.message_bus.publish(message["reply_topic"], status)
+            status = self.get_status()
+            self.message_bus.publish(message["reply_topic"], {
+                **status,
+                "active_zones": list(status["active_zones"]),
+                "moisture_data": dict(status["moisture_data"])
+            })
     
     def _handle_rain_detected(self, message: Dict[str, Any]):
         """Gère les notifications de pluie."""
         amount = message.get("amount", 0)
         
-        self.logger.info(f"Notification de pluie reçue: {amount}mm")
+        self.logger.info("Notification de pluie reçue: %smm", amount)
+        self._recent_rain = amount
+        self._recent_rain_time = time.monotonic_ns()
         
         # Si la quantité de pluie dépasse le seuil, arrêter toutes les zones actives
         if amount > self.rain_threshold:
-            self.logger.info(f"Arrêt de toutes les zones d'irrigation en raison de pluie ({amount}mm)")
-            for zone_id in list(self._active_zones):
-                self._stop_zone(zone_id)
+            self.logger.info("Arrêt de toutes les zones d'irrigation en raison de pluie (%smm)", amount)
+            stopped = []
+            mask = self._active_mask
+            while mask:
+                index = (mask & -mask).bit_length() - 1
+                mask &= mask - 1
+                zone_id = self._index_zone[index]
+                if self._stop_zone_nopublish(zone_id):
+                    stopped.append(zone_id)
+            if not stopped:
+                return
+            
+            # Un seul événement pour l'ensemble des zones arrêtées
+            stop_time = time.time()
+            self.message_bus.publish(_TOPIC_ZONES_STOPPED_BULK, {
+                "zone_ids": stopped,
+                "stop_time": stop_time,
+                "reason": "rain",
+                "amount": amount
+            })
+            
+            if self.per_zone_stop_events:
+                for zone_id in stopped:
+                    self.message_bus.publish(_TOPIC_ZONE_STOPPED, {
+                        "zone_id": zone_id,
+                        "stop_time": stop_time
+                    })
     
     def _handle_forecast_updated(self, message: Dict[str, Any]):
         """Gère les mises à jour des prévisions météo."""
         rain_probability = message.get("rain_probability", 0)
         
-        self.logger.info(f"Prévision de pluie mise à jour: {rain_probability}%")
+        self.logger.info("Prévision de pluie mise à jour: %s%%", rain_probability)
         
         # Pour l'instant, nous ne faisons rien de proactif avec cette information
         # Elle sera utilisée lors des prochaines demandes de démarrage d'irrigation
+        self._rain_forecast = rain_probability
     
     def _handle_soil_moisture(self, message: Dict[str, Any]):
         """Gère les mises à jour d'humidité du sol."""
@@ -309,29 +704,46 @@ class IrrigationModule(BaseModule):
             return
         
         # Trouver la zone associée à ce capteur
-        zone_id = None
-        for z_id, zone in self.zones.items():
-            if zone.get("moisture_sensor") == sensor_id:
-                zone_id = z_id
-                break
+        zone_id = self._sensor_to_zone.get(sensor_id)
         
-        if not zone_id:
+        # Mettre à jour l'humidité connue (invalide le statut en cache si elle change)
+        moisture_data = self._moisture_data
+        if zone_id and moisture_data is not None and moisture_data.get(zone_id) != moisture:
+            with self._zones_lock:
+                moisture_data[zone_id] = moisture
+                self._status_version += 1
+        
+        # Rien à faire pour les zones sans irrigation automatique
+        if zone_id not in self._auto_zones:
             return
         
-        self.logger.debug(f"Humidité du sol pour la zone {zone_id}: {moisture}%")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Humidité du sol pour la zone %s: %s%%", zone_id, moisture)
+        
+        # N'agir qu'au changement de décision (hystérésis entre les deux seuils)
+        thresholds = self.thresholds
+        if moisture < thresholds.moisture:
+            decision = "start"
+        elif moisture > thresholds.moisture_stop:
+            decision = "stop"
+        else:
+            decision = "idle"
+        decisions = self._last_moisture_decision
+        if decisions.get(zone_id) == decision:
+            return
+        decisions[zone_id] = decision
         
         # Vérifier si l'irrigation est nécessaire en fonction de l'humidité
-        if moisture < self.moisture_threshold and zone_id not in self._active_zones:
-            # Vérifier si l'irrigation automatique est activée pour cette zone
-            if self.zones[zone_id].get("auto_irrigation", False):
-                self.logger.info(f"Démarrage automatique de l'irrigation pour la zone {zone_id} (humidité: {moisture}%)")
-                self._start_zone(zone_id)
+        if decision == "start" and not self._is_active(zone_id):
+            self.logger.info("Démarrage automatique de l'irrigation pour la zone %s (humidité: %s%%)", zone_id, moisture)
+            if not self._start_zone(zone_id):
+                # Démarrage refusé (pluie...) : réévaluer au prochain échantillon
+                del decisions[zone_id]
         
         # Vérifier si l'irrigation doit être arrêtée
-        elif moisture > self.moisture_threshold + 10 and zone_id in self._active_zones:
-            if self.zones[zone_id].get("auto_irrigation", False):
-                self.logger.info(f"Arrêt automatique de l'irrigation pour la zone {zone_id} (humidité: {moisture}%)")
-                self._stop_zone(zone_id)
+        elif decision == "stop" and self._is_active(zone_id):
+            self.logger.info("Arrêt automatique de l'irrigation pour la zone %s (humidité: %s%%)", zone_id, moisture)
+            self._stop_zone(zone_id)
 
 # Exemple de configuration pour les tests
 SAMPLE_CONFIG = {
@@ -1,12 +1,126 @@
 import logging
+import sys
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+# Colonnes d'état vectorisées (optionnel)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from modules.base_module import BaseModule
 from modules.message_bus import MessageBus
 from modules.state_manager import StateManager
 
+# Capacités d'une lumière, sous forme de bits
+_CAP_DIMMABLE = 1
+_CAP_COLOR = 2
+_CAP_SECURITY = 4
+
+@dataclass(slots=True, frozen=True)
+class LightState:
+    """Paramètres appliqués à une lumière (immuables : remplacés à chaque changement)."""
+    state: bool
+    brightness: Optional[int] = None
+    color: Optional[str] = None
+    transition: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit en dictionnaire, sans les champs non définis."""
+        result = {"state": self.state}
+        if self.brightness is not None:
+            result["brightness"] = self.brightness
+        if self.color is not None:
+            result["color"] = self.color
+        if self.transition is not None:
+            result["transition"] = self.transition
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LightState":
+        """Reconstruit l'état depuis sa forme sérialisée."""
+        return cls(data.get("state", True), data.get("brightness"), data.get("color"), data.get("transition"))
+
+_LIGHT_OFF = LightState(False)
+
+class LightStateTable:
+    """État des lumières en colonnes parallèles (une ligne par lumière configurée)."""
+    __slots__ = ("index", "ids", "on", "brightness", "dimmable", "timeout")
+
+    def __init__(self, light_ids: Iterable[str], dimmable: Iterable[str], timeouts: Dict[str, float]):
+        self.ids = list(light_ids)
+        self.index = {light_id: i for i, light_id in enumerate(self.ids)}
+        count = len(self.ids)
+        dimmable = set(dimmable)
+        if NUMPY_AVAILABLE:
+            self.on = np.zeros(count, dtype=bool)
+            self.brightness = np.zeros(count, dtype=np.uint8)
+            self.dimmable = np.array([light_id in dimmable for light_id in self.ids], dtype=bool)
+            self.timeout = np.array([timeouts[light_id] for light_id in self.ids], dtype=np.float64)
+        else:
+            self.on = array("b", bytes(count))
+            self.brightness = array("B", bytes(count))
+            self.dimmable = array("b", [light_id in dimmable for light_id in self.ids])
+            self.timeout = array("d", [timeouts[light_id] for light_id in self.ids])
+
+    def rows(self, light_ids: Iterable[str]):
+        """Numéros de ligne d'un groupe de lumières (à précalculer par l'appelant)."""
+        rows = [self.index[light_id] for light_id in light_ids]
+        return np.array(rows, dtype=np.intp) if NUMPY_AVAILABLE else rows
+
+    def expired(self, rows, elapsed: float) -> List[str]:
+        """Lumières allumées parmi `rows` dont le délai d'inactivité est dépassé."""
+        ids = self.ids
+        if NUMPY_AVAILABLE:
+            selected = rows[self.on[rows] & (self.timeout[rows] < elapsed)]
+            return [ids[i] for i in selected]
+        return [ids[i] for i in rows if self.on[i] and self.timeout[i] < elapsed]
+
+    def set(self, light_id: str, params: Optional[LightState]) -> None:
+        """Reporte l'état d'une lumière (None : éteinte) ; luminosité arrondie à l'entier entre 0 et 100."""
+        idx = self.index.get(light_id)
+        if idx is None:
+            return
+        if params is not None and params.state:
+            self.on[idx] = True
+            brightness = 100 if params.brightness is None else int(round(params.brightness))
+            self.brightness[idx] = max(0, min(100, brightness))
+        else:
+            self.on[idx] = False
+            self.brightness[idx] = 0
+
+    def dimmable_on(self) -> List[str]:
+        """Lumières graduables actuellement allumées."""
+        ids = self.ids
+        if NUMPY_AVAILABLE:
+            return [ids[i] for i in np.flatnonzero(self.on & self.dimmable)]
+        return [ids[i] for i, (on, dimmable) in enumerate(zip(self.on, self.dimmable)) if on and dimmable]
+
+    def summary(self) -> Dict[str, Any]:
+        """Nombre de lumières allumées et luminosité moyenne des lumières allumées."""
+        if NUMPY_AVAILABLE:
+            lights_on = int(np.count_nonzero(self.on))
+            levels = self.brightness[self.on]
+            average_brightness = float(levels.mean()) if levels.size else None
+        else:
+            lights_on = sum(self.on)
+            levels = [level for level, on in zip(self.brightness, self.on) if on]
+            average_brightness = sum(levels) / len(levels) if levels else None
+        
+        return {
+            "lights": len(self.ids),
+            "on": lights_on,
+            "average_brightness": average_brightness
+        }
+
 class LightingModule(BaseModule):
     """
     Module de gestion de l'éclairage intelligent.
@@ -29,6 +143,24 @@ class LightingModule(BaseModule):
         # Configuration des lumières
         self.lights = config.get("lights", {})
         
+        # Index précalculés (la configuration des lumières ne change pas en cours d'exécution)
+        self._lights_by_room: Dict[str, List[str]] = {}
+        for light_id, light_config in self.lights.items():
+            self._lights_by_room.setdefault(light_config.get("room"), []).append(light_id)
+        self._caps: Dict[str, int] = {
+            light_id: (_CAP_DIMMABLE if light_config.get("dimmable", False) else 0)
+                      | (_CAP_COLOR if light_config.get("color", False) else 0)
+                      | (_CAP_SECURITY if light_config.get("security", False) else 0)
+            for light_id, light_config in self.lights.items()
+        }
+        self._light_table = LightStateTable(self.lights,
+                                            (light_id for light_id, caps in self._caps.items()
+                                             if caps & _CAP_DIMMABLE),
+                                            {light_id: light_config.get("motion_timeout", 300)  # 5 minutes par défaut
+                                             for light_id, light_config in self.lights.items()})
+        self._room_rows = {room_id: self._light_table.rows(light_ids)
+                           for room_id, light_ids in self._lights_by_room.items()}
+        
         # Configuration des scènes d'éclairage
         self.scenes = config.get("scenes", {})
         
@@ -39,29 +171,60 @@ class LightingModule(BaseModule):
         self.auto_mode_enabled = config.get("auto_mode_enabled", True)
         self.presence_based_lighting = config.get("presence_based_lighting", True)
         self.light_sensor_threshold = config.get("light_sensor_threshold", 200)  # lux
+        self.lux_hysteresis = config.get("lux_hysteresis", 5)  # lux, variation ignorée par l'automatisation
         self.nightlight_mode = config.get("nightlight_mode", False)
         self.nightlight_brightness = config.get("nightlight_brightness", 10)  # %
+        self.night_windows = config.get("night_windows", [{"start": "22:00", "end": "06:00"}])
+        self._night_transitions = self._compile_night_transitions(self.night_windows)
         
         # État interne
-        self._active_lights = {}  # light_id -> {brightness, color, etc.}
+        self._active_lights: Dict[str, LightState] = {}  # light_id -> paramètres appliqués
         self._active_scene = None
         self._last_motion = {}  # room_id -> timestamp
+        self._last_motion_processed: Dict[str, float] = {}  # room_id -> instant monotone du dernier traitement
+        self.motion_debounce_sec = config.get("motion_debounce_sec", 2.0)  # secondes
         self._ambient_light_levels = {}  # sensor_id -> lux
-        
-        self.logger.info(f"Module d'éclairage initialisé avec {len(self.lights)} lumières et {len(self.scenes)} scènes")
+        self._room_lux: Dict[str, Any] = {}  # room_id -> dernière mesure de luminosité
+        self._last_processed_lux: Dict[str, float] = {}  # sensor_id -> mesure de la dernière automatisation
+        self._is_night_cached = (float("-inf"), False)  # (instant monotone du calcul, nuit ?)
+        self._sensor_room_cache: Dict[str, str] = {}  # sensor_id -> room_id
+        self._sensor_state_keys: Dict[str, str] = {}  # sensor_id -> clé d'état "sensor_<id>" (internée)
+        self._state_key = sys.intern(f"{self.module_id}_state")
+        
+        # Sauvegarde différée de l'état (les rafales de changements sont regroupées)
+        self._state_flush_interval = config.get("state_flush_interval", 1.0)  # secondes
+        self._state_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._state_lock = threading.Lock()
+        self._lights_lock = threading.Lock()  # modifications de _active_lights vs instantané du minuteur
+        self._persist_executor: Optional[ThreadPoolExecutor] = None  # écritures hors du thread appelant
+        
+        # Publication groupée des événements (vidée à batch_size événements ou après batch_window_ms)
+        self._event_batch_size = config.get("batch_size", 64)
+        self._event_batch_window = config.get("batch_window_ms", 50) / 1000.0  # secondes
+        self._pending_events: List[Tuple[str, Dict[str, Any]]] = []
+        self._events_timer: Optional[threading.Timer] = None
+        self._events_lock = threading.Lock()
+        
+        self.logger.info("Module d'éclairage initialisé avec %d lumières et %d scènes", len(self.lights), len(self.scenes))
         
         # Enregistrement des gestionnaires de messages
         self._register_handlers()
     
     def _register_handlers(self):
         """Enregistre les gestionnaires de messages pour ce module."""
-        self.message_bus.register_handler("lighting/set", self._handle_set_light)
-        self.message_bus.register_handler("lighting/toggle", self._handle_toggle_light)
-        self.message_bus.register_handler("lighting/scene", self._handle_set_scene)
-        self.message_bus.register_handler("lighting/status", self._handle_status_request)
-        self.message_bus.register_handler("sensor/motion", self._handle_motion_detected)
-        self.message_bus.register_handler("sensor/light", self._handle_light_sensor)
-        self.message_bus.register_handler("home/mode", self._handle_home_mode_changed)
+        # Table de dispatch construite une fois, enregistrée en un seul appel
+        self._dispatch = {
+            "lighting/set": self._handle_set_light,
+            "lighting/toggle": self._handle_toggle_light,
+            "lighting/scene": self._handle_set_scene,
+            "lighting/status": self._handle_status_request,
+            "sensor/motion": self._handle_motion_detected,
+            "sensor/light": self._handle_light_sensor,
+            "sensor/config_changed": self._handle_sensor_config_changed,
+            "home/mode": self._handle_home_mode_changed
+        }
+        self.message_bus.register_handlers(self._dispatch)
     
     def start(self):
         """Démarre le module et initialise les planifications."""
@@ -70,6 +233,9 @@ class LightingModule(BaseModule):
         # Charger l'état précédent si disponible
         self._load_state()
         
+        # Les sauvegardes sont sérialisées sur un unique thread dédié
+        self._persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lighting-persist")
+        
         # Initialiser les planifications
         self._setup_schedules()
         
@@ -80,35 +246,129 @@ class LightingModule(BaseModule):
         """Arrête le module et sauvegarde l'état actuel."""
         self.logger.info("Arrêt du module d'éclairage")
         
-        # Sauvegarde de l'état
-        self._save_state()
+        # Publier les événements en attente
+        self._flush_events()
+        
+        # Terminer les sauvegardes en cours, puis sauvegarder l'état de façon synchrone
+        if self._persist_executor is not None:
+            self._persist_executor.shutdown(wait=True)
+            self._persist_executor = None
+        self._flush_state(force=True)
         
         # Définir le statut comme inactif
         self.active = False
     
     def _load_state(self):
         """Charge l'état précédent depuis le gestionnaire d'état."""
-        state = self.state_manager.get_state(f"{self.module_id}_state")
+        state = self.state_manager.get_state(self._state_key)
         if state:
             self.logger.info("Chargement de l'état précédent")
             if "active_lights" in state:
                 # Vérifier si les lumières sont toujours valides dans la configuration
-                valid_lights = {light_id: settings 
+                valid_lights = {light_id: LightState.from_dict(settings)
                               for light_id, settings in state["active_lights"].items() 
                               if light_id in self.lights}
                 self._active_lights = valid_lights
+                for light_id, settings in valid_lights.items():
+                    self._light_table.set(light_id, settings)
             
             if "active_scene" in state and state["active_scene"] in self.scenes:
                 self._active_scene = state["active_scene"]
     
     def _save_state(self):
         """Sauvegarde l'état actuel dans le gestionnaire d'état."""
+        # Appelé depuis le minuteur de sauvegarde : copier les lumières actives sous le verrou
+        # que prennent les gestionnaires pour les modifier (les LightState eux-mêmes sont immuables)
+        with self._lights_lock:
+            active_lights = list(self._active_lights.items())
+            active_scene = self._active_scene
         state = {
-            "active_lights": self._active_lights,
-            "active_scene": self._active_scene,
+            "active_lights": {light_id: params.to_dict() for light_id, params in active_lights},
+            "active_scene": active_scene,
             "last_update": time.time()
         }
-        self.state_manager.set_state(f"{self.module_id}_state", state)
+        if self._persist_executor is not None:
+            self._persist_executor.submit(self.state_manager.set_state, self._state_key, state)
+        else:
+            self.state_manager.set_state(self._state_key, state)
+    
+    def _mark_dirty(self):
+        """Signale un changement d'état et programme une sauvegarde différée."""
+        with self._state_lock:
+            self._state_dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._state_flush_interval, self._flush_state)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_state(self, force: bool = False):
+        """
+        Sauvegarde l'état s'il a changé depuis la dernière sauvegarde.
+        
+        Args:
+            force: Annuler la sauvegarde programmée et sauvegarder immédiatement
+        """
+        with self._state_lock:
+            if self._flush_timer is not None:
+                if force:
+                    self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            if not (self._state_dirty or force):
+                return
+            self._state_dirty = False
+        
+        self._save_state()
+    
+    def _publish_batched(self, topic: str, payload: Dict[str, Any]):
+        """
+        Ajoute un événement au lot en attente, publié dès qu'il est plein ou à l'expiration de la fenêtre.
+        
+        Args:
+            topic: Sujet de publication
+            payload: Données de l'événement
+        """
+        batch = None
+        with self._events_lock:
+            self._pending_events.append((topic, payload))
+            if len(self._pending_events) >= self._event_batch_size:
+                batch, self._pending_events = self._pending_events, []
+                if self._events_timer is not None:
+                    self._events_timer.cancel()
+                    self._events_timer = None
+            elif self._events_timer is None:
+                self._events_timer = threading.Timer(self._event_batch_window, self._flush_events)
+                self._events_timer.daemon = True
+                self._events_timer.start()
+        
+        if batch:
+            self._send_events(batch)
+    
+    def _flush_events(self):
+        """Publie immédiatement les événements en attente."""
+        with self._events_lock:
+            batch, self._pending_events = self._pending_events, []
+            if self._events_timer is not None:
+                self._events_timer.cancel()
+                self._events_timer = None
+        
+        if batch:
+            self._send_events(batch)
+    
+    def _send_events(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Envoie un lot d'événements au bus, en un seul appel si le bus le permet.
+        
+        Args:
+            events: Liste de couples (topic, données)
+        """
+        publish_batch = getattr(self.message_bus, "publish_batch", None)
+        if publish_batch is not None:
+            publish_batch(events)
+            return
+        
+        for topic, payload in events:
+            self.message_bus.publish(topic, payload)
     
     def _setup_schedules(self):
         """Configure les planifications d'éclairage."""
@@ -117,15 +377,15 @@ class LightingModule(BaseModule):
         # Ici, nous pourrions ajouter des tâches planifiées
         # Pour cet exemple, nous simulons simplement la configuration
         for schedule_id, schedule in self.schedules.items():
-            self.logger.info(f"Planification configurée: {schedule_id}")
+            self.logger.info("Planification configurée: %s", schedule_id)
             
             # Dans une implémentation réelle, nous utiliserions un scheduler
             # comme APScheduler pour configurer les tâches
     
-    def _set_light(self, light_id: str, state: bool, brightness: Optional[int] = None, 
-                   color: Optional[str] = None, transition: Optional[int] = None) -> bool:
+    def _compute_light_params(self, light_id: str, state: bool, brightness: Optional[int] = None,
+                              color: Optional[str] = None, transition: Optional[int] = None) -> Optional[LightState]:
         """
-        Définit l'état d'une lumière.
+        Valide une commande de lumière et construit ses paramètres, sans l'appliquer.
         
         Args:
             light_id: Identifiant de la lumière
@@ -135,62 +395,103 @@ class LightingModule(BaseModule):
             transition: Durée de transition en secondes (optionnel)
             
         Returns:
-            bool: True si réussi, False sinon
+            LightState: Paramètres de commande, ou None si la lumière est inconnue
         """
-        if light_id not in self.lights:
-            self.logger.warning(f"Lumière {light_id} inconnue")
-            return False
-        
-        light_config = self.lights[light_id]
+        caps = self._caps.get(light_id)
+        if caps is None:
+            self.logger.warning("Lumière %s inconnue", light_id)
+            return None
         
         # Vérifier les capacités de la lumière
-        if brightness is not None and not light_config.get("dimmable", False):
-            self.logger.warning(f"Lumière {light_id} ne supporte pas la gradation")
+        if brightness is not None and not caps & _CAP_DIMMABLE:
+            self.logger.warning("Lumière %s ne supporte pas la gradation", light_id)
             brightness = None
         
-        if color is not None and not light_config.get("color", False):
-            self.logger.warning(f"Lumière {light_id} ne supporte pas les couleurs")
+        if color is not None and not caps & _CAP_COLOR:
+            self.logger.warning("Lumière %s ne supporte pas les couleurs", light_id)
             color = None
         
         # Construire les paramètres de commande
-        params = {
-            "state": state
-        }
-        
         if brightness is not None:
-            params["brightness"] = max(0, min(100, brightness))
+            brightness = max(0, min(100, brightness))
         
-        if color is not None:
-            params["color"] = color
-            
-        if transition is not None:
-            params["transition"] = transition
+        return LightState(state, brightness, color, transition)
+    
+    def _apply_light_changes(self, changes: List[Tuple[str, LightState]], scene_id: Optional[str] = None,
+                             mode: Optional[str] = None):
+        """
+        Applique un lot de changements de lumières, avec une seule publication et une seule sauvegarde.
         
+        Args:
+            changes: Liste de couples (light_id, paramètres validés)
+            scene_id: Scène à l'origine du lot (None pour une commande isolée)
+            mode: Mode de la maison à l'origine du lot (None pour une commande isolée)
+        """
         # Dans une implémentation réelle, nous enverrions des commandes aux dispositifs physiques
         # Ici, nous simulons simplement le changement d'état
-        
-        if state:
-            self.logger.info(f"Allumage de la lumière {light_id} avec paramètres: {params}")
-            
-            # Mettre à jour l'état interne
-            self._active_lights[light_id] = params
-        else:
-            self.logger.info(f"Extinction de la lumière {light_id}")
-            
-            # Supprimer de l'état interne si éteint
-            if light_id in self._active_lights:
-                del self._active_lights[light_id]
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        with self._lights_lock:
+            for light_id, params in changes:
+                if params.state:
+                    if log_info:
+                        self.logger.info("Allumage de la lumière %s avec paramètres: %s", light_id, params.to_dict())
+                    
+                    # Mettre à jour l'état interne
+                    self._active_lights[light_id] = params
+                    self._light_table.set(light_id, params)
+                else:
+                    if log_info:
+                        self.logger.info("Extinction de la lumière %s", light_id)
+                    
+                    # Supprimer de l'état interne si éteint
+                    self._active_lights.pop(light_id, None)
+                    self._light_table.set(light_id, None)
         
         # Publier un événement
-        self.message_bus.publish("lighting/light_changed", {
-            "light_id": light_id,
-            "params": params,
-            "timestamp": time.time()
-        })
+        timestamp = time.time()
+        if scene_id is not None:
+            self._publish_batched("lighting/scene_applied", {
+                "scene_id": scene_id,
+                "changes": [{"light_id": light_id, "params": params.to_dict()} for light_id, params in changes],
+                "timestamp": timestamp
+            })
+        elif mode is not None:
+            self._publish_batched("lighting/mode_applied", {
+                "mode": mode,
+                "changes": [{"light_id": light_id, "params": params.to_dict()} for light_id, params in changes],
+                "timestamp": timestamp
+            })
+        else:
+            for light_id, params in changes:
+                self._publish_batched("lighting/light_changed", {
+                    "light_id": light_id,
+                    "params": params.to_dict(),
+                    "timestamp": timestamp
+                })
+        
+        # Mettre à jour l'état (sauvegarde différée)
+        self._mark_dirty()
+    
+    def _set_light(self, light_id: str, state: bool, brightness: Optional[int] = None, 
+                   color: Optional[str] = None, transition: Optional[int] = None) -> bool:
+        """
+        Définit l'état d'une lumière.
         
-        # Mettre à jour l'état
-        self._save_state()
+        Args:
+            light_id: Identifiant de la lumière
+            state: État (True = allumé, False = éteint)
+            brightness: Luminosité (0-100, optionnel)
+            color: Couleur en format hex ou nom (optionnel)
+            transition: Durée de transition en secondes (optionnel)
+            
+        Returns:
+            bool: True si réussi, False sinon
+        """
+        params = self._compute_light_params(light_id, state, brightness, color, transition)
+        if params is None:
+            return False
         
+        self._apply_light_changes([(light_id, params)])
         return True
     
     def _toggle_light(self, light_id: str) -> bool:
@@ -204,7 +505,7 @@ class LightingModule(BaseModule):
             bool: Nouvel état (True = allumé, False = éteint)
         """
         if light_id not in self.lights:
-            self.logger.warning(f"Lumière {light_id} inconnue")
+            self.logger.warning("Lumière %s inconnue", light_id)
             return False
         
         # Déterminer l'état actuel
@@ -227,37 +528,123 @@ class LightingModule(BaseModule):
             bool: True si activé avec succès, False sinon
         """
         if scene_id not in self.scenes:
-            self.logger.warning(f"Scène {scene_id} inconnue")
+            self.logger.warning("Scène %s inconnue", scene_id)
             return False
         
         scene = self.scenes[scene_id]
         
-        self.logger.info(f"Activation de la scène {scene_id}")
+        self.logger.info("Activation de la scène %s", scene_id)
         
-        # Appliquer les paramètres de lumière pour cette scène
+        # Valider les paramètres de toutes les lumières de la scène avant de les appliquer
+        changes = []
         for light_setting in scene.get("lights", []):
             light_id = light_setting.get("id")
-            state = light_setting.get("state", True)
-            brightness = light_setting.get("brightness")
-            color = light_setting.get("color")
-            transition = light_setting.get("transition", 1)
-            
-            self._set_light(light_id, state, brightness, color, transition)
-        
-        # Mettre à jour la scène active
+            params = self._compute_light_params(light_id,
+                                                light_setting.get("state", True),
+                                                light_setting.get("brightness"),
+                                                light_setting.get("color"),
+                                                light_setting.get("transition", 1))
+            if params is not None:
+                changes.append((light_id, params))
+        
+        # Mettre à jour la scène active, puis appliquer le lot (une seule sauvegarde)
         self._active_scene = scene_id
+        self._apply_light_changes(changes, scene_id)
         
         # Publier un événement
-        self.message_bus.publish("lighting/scene_activated", {
+        self._publish_batched("lighting/scene_activated", {
             "scene_id": scene_id,
             "timestamp": time.time()
         })
         
-        # Mettre à jour l'état
-        self._save_state()
-        
         return True
     
+    def _get_sensor_room(self, sensor_id: str) -> Optional[str]:
+        """
+        Récupère la pièce d'un capteur, mise en cache après la première lecture.
+        
+        Args:
+            sensor_id: Identifiant du capteur
+            
+        Returns:
+            str: Identifiant de la pièce, ou None si le capteur n'est pas affecté
+        """
+        room_id = self._sensor_room_cache.get(sensor_id)
+        if room_id is not None:
+            return room_id
+        
+        key = self._sensor_state_keys.get(sensor_id)
+        if key is None:
+            key = self._sensor_state_keys[sensor_id] = sys.intern(f"sensor_{sensor_id}")
+        
+        sensor_info = self.state_manager.get_state(key)
+        if not sensor_info or "room" not in sensor_info:
+            return None
+        
+        room_id = self._sensor_room_cache[sensor_id] = sensor_info["room"]
+        return room_id
+    
+    def invalidate_sensor_cache(self, sensor_id: Optional[str] = None):
+        """
+        Oublie la pièce mise en cache d'un capteur (ou de tous les capteurs).
+        
+        Args:
+            sensor_id: Identifiant du capteur (None pour tout invalider)
+        """
+        if sensor_id is None:
+            self._sensor_room_cache.clear()
+        else:
+            self._sensor_room_cache.pop(sensor_id, None)
+    
+    def _compile_night_transitions(self, windows: List[Dict[str, str]]) -> List[Tuple[int, bool]]:
+        """
+        Convertit les plages de nuit en transitions triées par minute de la journée.
+        
+        Args:
+            windows: Plages {"start": "HH:MM", "end": "HH:MM"} (une plage peut passer minuit)
+            
+        Returns:
+            Liste triée de (minute du jour, nuit ?) ; les plages ne doivent pas se chevaucher
+        """
+        transitions = []
+        for window in windows:
+            try:
+                start_hour, start_minute = window["start"].split(":")
+                end_hour, end_minute = window["end"].split(":")
+                start = int(start_hour) * 60 + int(start_minute)
+                end = int(end_hour) * 60 + int(end_minute)
+            except (KeyError, ValueError, AttributeError, TypeError) as e:
+                self.logger.error("Plage de nuit invalide %s: %s", window, e)
+                continue
+            if not (0 <= start < 24 * 60 and 0 <= end < 24 * 60):
+                self.logger.error("Plage de nuit invalide %s: heure hors limites", window)
+                continue
+            transitions.append((start, True))
+            transitions.append((end, False))
+        transitions.sort()
+        return transitions
+    
+    def _is_night(self) -> bool:
+        """
+        Indique si l'heure courante tombe dans une plage de nuit, réévalué au plus une fois par minute.
+        
+        Returns:
+            bool: True pendant une plage de nuit (22h-6h par défaut)
+        """
+        now = time.monotonic()
+        computed_at, is_night = self._is_night_cached
+        if now - computed_at > 60:
+            transitions = self._night_transitions
+            if transitions:
+                current = datetime.now()
+                # La dernière transition passée donne l'état ; avant la première, celle de la veille s'applique
+                idx = bisect_right(transitions, (current.hour * 60 + current.minute, True)) - 1
+                is_night = transitions[idx][1]
+            else:
+                is_night = False
+            self._is_night_cached = (now, is_night)
+        return is_night
+    
     def _handle_motion_based_lighting(self, room_id: str, motion: bool):
         """
         Gère l'éclairage basé sur la détection de mouvement.
@@ -270,23 +657,24 @@ class LightingModule(BaseModule):
             return
         
         # Mettre à jour le timestamp du dernier mouvement
+        now = time.time()
         if motion:
-            self._last_motion[room_id] = time.time()
+            self._last_motion[room_id] = now
+            
+            # Rafale de détections : la décision d'allumage déjà prise reste valable
+            processed_at = time.monotonic()
+            if processed_at - self._last_motion_processed.get(room_id, float("-inf")) < self.motion_debounce_sec:
+                return
+            self._last_motion_processed[room_id] = processed_at
         
         # Trouver les lumières dans cette pièce
-        room_lights = [light_id for light_id, config in self.lights.items() 
-                      if config.get("room") == room_id]
+        room_lights = self._lights_by_room.get(room_id, ())
         
         if not room_lights:
             return
         
         # Vérifier les niveaux de luminosité si des capteurs sont disponibles
-        light_level = None
-        for sensor_id, lux in self._ambient_light_levels.items():
-            sensor_room = self.state_manager.get_state(f"sensor_{sensor_id}")
-            if sensor_room and sensor_room.get("room") == room_id:
-                light_level = lux
-                break
+        light_level = self._room_lux.get(room_id)
         
         # Déterminer si nous devons allumer les lumières
         should_turn_on = (
@@ -294,19 +682,24 @@ class LightingModule(BaseModule):
             (light_level is None or light_level < self.light_sensor_threshold)
         )
         
-        now = datetime.now()
-        is_night = 22 <= now.hour or now.hour < 6
+        if should_turn_on:
+            # Luminosité commune à toutes les lumières de la pièce
+            brightness = self.nightlight_brightness if self.nightlight_mode and self._is_night() else None
+            changes = []
+            for light_id in room_lights:
+                params = self._compute_light_params(light_id, True, brightness)
+                if params is not None:
+                    changes.append((light_id, params))
+        elif not motion:
+            # Éteindre en une passe les lumières allumées dont le délai d'inactivité est dépassé
+            elapsed = now - self._last_motion.get(room_id, 0)
+            changes = [(light_id, _LIGHT_OFF)
+                       for light_id in self._light_table.expired(self._room_rows[room_id], elapsed)]
+        else:
+            changes = []
         
-        for light_id in room_lights:
-            if should_turn_on:
-                brightness = self.nightlight_brightness if is_night and self.nightlight_mode else None
-                self._set_light(light_id, True, brightness)
-            elif not motion and light_id in self._active_lights:
-                # Vérifier si le mouvement s'est arrêté depuis un certain temps
-                timeout = self.lights[light_id].get("motion_timeout", 300)  # 5 minutes par défaut
-                last_motion_time = self._last_motion.get(room_id, 0)
-                if time.time() - last_motion_time > timeout:
-                    self._set_light(light_id, False)
+        if changes:
+            self._apply_light_changes(changes)
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -315,14 +708,17 @@ class LightingModule(BaseModule):
         Returns:
             Dict: Statut du système d'éclairage
         """
+        with self._lights_lock:
+            active_lights = list(self._active_lights.items())
         return {
-            "active_lights": self._active_lights,
+            "active_lights": {light_id: params.to_dict() for light_id, params in active_lights},
             "active_scene": self._active_scene,
             "light_count": len(self.lights),
             "scene_count": len(self.scenes),
             "auto_mode": self.auto_mode_enabled,
             "presence_based": self.presence_based_lighting,
-            "nightlight_mode": self.nightlight_mode
+            "nightlight_mode": self.nightlight_mode,
+            "summary": self._light_table.summary()
         }
     
     # Gestionnaires de messages
@@ -402,13 +798,11 @@ class LightingModule(BaseModule):
         if not sensor_id:
             return
         
-        # Récupérer les informations sur le capteur
-        sensor_info = self.state_manager.get_state(f"sensor_{sensor_id}")
-        if not sensor_info or "room" not in sensor_info:
+        # Récupérer la pièce du capteur
+        room_id = self._get_sensor_room(sensor_id)
+        if room_id is None:
             return
         
-        room_id = sensor_info["room"]
-        
         # Traiter l'éclairage basé sur le mouvement
         self._handle_motion_based_lighting(room_id, motion)
     
@@ -423,32 +817,47 @@ class LightingModule(BaseModule):
         # Mettre à jour les niveaux de luminosité ambiante
         self._ambient_light_levels[sensor_id] = lux
         
+        # Récupérer la pièce du capteur et y reporter la dernière mesure
+        room_id = self._get_sensor_room(sensor_id)
+        if room_id is None:
+            return
+        self._room_lux[room_id] = lux
+        
+        # Une variation inférieure à l'hystérésis ne peut pas changer le résultat de l'automatisation
+        last_lux = self._last_processed_lux.get(sensor_id)
+        if last_lux is not None and abs(lux - last_lux) < self.lux_hysteresis:
+            return
+        
         # Si en mode automatique, vérifier si nous devons ajuster les lumières
         if self.auto_mode_enabled:
-            # Récupérer les informations sur le capteur
-            sensor_info = self.state_manager.get_state(f"sensor_{sensor_id}")
-            if not sensor_info or "room" not in sensor_info:
-                return
-            
-            room_id = sensor_info["room"]
-            
             # Vérifier s'il y a eu un mouvement récent dans cette pièce
             has_recent_motion = False
             if room_id in self._last_motion:
                 timeout = 300  # 5 minutes par défaut
                 has_recent_motion = (time.time() - self._last_motion[room_id]) < timeout
             
+            if not has_recent_motion:
+                return
+            self._last_processed_lux[sensor_id] = lux
+            
             # Trouver les lumières dans cette pièce
-            room_lights = [light_id for light_id, config in self.lights.items() 
-                          if config.get("room") == room_id]
+            room_lights = self._lights_by_room.get(room_id, ())
             
-            # Ajuster les lumières en fonction du niveau de luminosité
-            for light_id in room_lights:
-                if has_recent_motion:
-                    if lux < self.light_sensor_threshold and light_id not in self._active_lights:
-                        self._set_light(light_id, True)
-                    elif lux > self.light_sensor_threshold + 50 and light_id in self._active_lights:
-                        self._set_light(light_id, False)
+            # Planifier les ajustements en fonction du niveau de luminosité, puis les appliquer en un lot
+            active_lights = self._active_lights
+            if lux < self.light_sensor_threshold:
+                changes = [(light_id, LightState(True)) for light_id in room_lights if light_id not in active_lights]
+            elif lux > self.light_sensor_threshold + 50:
+                changes = [(light_id, _LIGHT_OFF) for light_id in room_lights if light_id in active_lights]
+            else:
+                changes = []
+            
+            if changes:
+                self._apply_light_changes(changes)
+    
+    def _handle_sensor_config_changed(self, message: Dict[str, Any]):
+        """Gère les changements de configuration des capteurs (affectation à une pièce)."""
+        self.invalidate_sensor_cache(message.get("sensor_id"))
     
     def _handle_home_mode_changed(self, message: Dict[str, Any]):
         """Gère les changements de mode de la maison."""
@@ -457,14 +866,16 @@ class LightingModule(BaseModule):
         if not mode:
             return
         
-        self.logger.info(f"Mode de la maison changé: {mode}")
+        self.logger.info("Mode de la maison changé: %s", mode)
         
         # Ajuster les paramètres en fonction du mode
         if mode == "away":
-            # Éteindre toutes les lumières sauf celles marquées pour la sécurité
-            for light_id in list(self._active_lights.keys()):
-                if not self.lights.get(light_id, {}).get("security", False):
-                    self._set_light(light_id, False)
+            # Éteindre en un seul lot toutes les lumières sauf celles marquées pour la sécurité
+            caps = self._caps
+            changes = [(light_id, _LIGHT_OFF) for light_id in self._active_lights
+                       if not caps.get(light_id, 0) & _CAP_SECURITY]
+            if changes:
+                self._apply_light_changes(changes, mode=mode)
             
             # Désactiver le mode automatique basé sur la présence
             self.presence_based_lighting = False
@@ -477,10 +888,13 @@ class LightingModule(BaseModule):
             # Activer le mode veilleuse
             self.nightlight_mode = True
             
-            # Ajuster les lumières actuellement allumées
-            for light_id in self._active_lights:
-                if self.lights.get(light_id, {}).get("dimmable", False):
-                    self._set_light(light_id, True, self.nightlight_brightness)
+            # Ajuster en un seul lot les lumières graduables actuellement allumées
+            # (capacité déjà vérifiée par la table : pas de revalidation par lumière)
+            brightness = max(0, min(100, self.nightlight_brightness))
+            changes = [(light_id, LightState(True, brightness))
+                       for light_id in self._light_table.dimmable_on()]
+            if changes:
+                self._apply_light_changes(changes, mode=mode)
             
         elif mode == "day":
             # Désactiver le mode veilleuse
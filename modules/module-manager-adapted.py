@@ -12,29 +12,219 @@ Ce composant est responsable de:
 import os
 import sys
 import json
+import filecmp
 import hashlib
+import compileall
 import shutil
 import tempfile
 import time
-from datetime import datetime
+import zipfile
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 import threading
-import schedule
 import requests
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple, Any, Union, Set
 
 from utils.logger import get_logger, log_execution_time
 
+# Sérialisation JSON accélérée pour le registre (optionnelle)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Analyse JSON en flux de la liste des dépôts (optionnelle)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Décodage et validation typés des fichiers metadata.json (optionnel)
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 # Configuration du logger
 logger = get_logger("ModuleManager")
 
+# Points d'accès de l'API GitHub
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+# Nombre maximum de dépôts interrogés par requête GraphQL (limite de nœuds)
+GRAPHQL_BATCH_SIZE = 100
+
+# Préfixes des dépôts hébergeant des composants Alfred, et type de composant associé
+_PREFIX_TO_TYPE = {
+    "alfred-module-": "module",
+    "alfred-agent-": "agent",
+    "alfred-provider-": "provider",
+}
+COMPONENT_REPO_PREFIXES = tuple(_PREFIX_TO_TYPE)
+
+# Nombre de téléchargements de métadonnées simultanés (sans token GitHub)
+METADATA_FETCH_WORKERS = 8
+
+# Taille au-delà de laquelle une archive téléchargée déborde de la mémoire vers le disque
+DOWNLOAD_SPOOL_MAX_SIZE = 32 << 20
+
+# Champs de metadata.json repris dans le registre, avec leur valeur par défaut
+# ("name" prend par défaut le nom du dépôt)
+_METADATA_DEFAULTS = {
+    "name": "",
+    "description": "",
+    "version": "0.1.0",
+    "dependencies": [],
+    "provides": [],
+    "category": "general",
+}
+
+if MSGSPEC_AVAILABLE:
+    class ComponentMetadata(msgspec.Struct):
+        """Schéma du fichier metadata.json d'un composant"""
+        name: str = ""
+        description: str = ""
+        version: str = "0.1.0"
+        dependencies: List[str] = []
+        provides: List[str] = []
+        category: str = "general"
+
+
+def _parse_metadata(raw: Union[str, bytes], repo_name: str) -> Dict:
+    """
+    Décode et valide le contenu d'un fichier metadata.json
+    
+    Args:
+        raw: Contenu JSON brut
+        repo_name: Nom du dépôt, utilisé comme nom par défaut
+        
+    Returns:
+        Dictionnaire des champs de métadonnées, valeurs par défaut comprises
+        
+    Raises:
+        ValueError: Si le JSON est invalide ou si un champ n'a pas le type attendu
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            metadata = msgspec.structs.asdict(msgspec.json.decode(raw, type=ComponentMetadata))
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    else:
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("metadata.json doit contenir un objet JSON")
+        
+        metadata = {}
+        for field, default in _METADATA_DEFAULTS.items():
+            value = data.get(field, default)
+            if not isinstance(value, type(default)):
+                raise ValueError(f"Champ '{field}' invalide: {type(value).__name__} au lieu de "
+                                 f"{type(default).__name__}")
+            if isinstance(value, list):
+                if not all(isinstance(item, str) for item in value):
+                    raise ValueError(f"Champ '{field}' invalide: liste de chaînes attendue")
+                value = list(value)
+            metadata[field] = value
+    
+    if not metadata["name"]:
+        metadata["name"] = repo_name
+    return metadata
+
+
+def _registry_dumps(data: Dict) -> bytes:
+    """Sérialise le registre en JSON indenté, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _registry_loads(data: bytes) -> Dict:
+    """Désérialise le registre JSON, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _journal_dumps(record: Dict) -> bytes:
+    """Sérialise un enregistrement du journal sur une seule ligne, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _fast_copy(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """
+    Copie un fichier avec ses métadonnées en déléguant le transfert au noyau
+    
+    Sous Linux, os.copy_file_range copie sans passer par l'espace utilisateur
+    (et partage les blocs sur les systèmes de fichiers qui le permettent, ex. Btrfs/XFS).
+    Ailleurs, ou si le noyau refuse, retombe sur shutil.copy2.
+    
+    Args:
+        src: Fichier source
+        dst: Fichier de destination
+        follow_symlinks: Suivre les liens symboliques (voir shutil.copy2)
+        
+    Returns:
+        Chemin du fichier de destination
+    """
+    if hasattr(os, "copy_file_range") and (follow_symlinks or not os.path.islink(src)):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            # copy_file_range arrêté avant la fin (ex. pseudo-fichiers, certains FUSE) : copie classique
+            if remaining == 0:
+                shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+                return dst
+        except OSError:
+            # Noyau trop ancien, systèmes de fichiers différents, etc.
+            pass
+    
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _sha256_fileobj(fileobj) -> str:
+    """
+    Calcule l'empreinte SHA-256 d'un fichier ouvert en mode binaire
+    
+    Args:
+        fileobj: Objet fichier positionné au début des données
+        
+    Returns:
+        Empreinte hexadécimale
+    """
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: boucle de lecture en C, implémentation OpenSSL
+        return hashlib.file_digest(fileobj, "sha256").hexdigest()
+    
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
 class ModuleManager:
     """Gère la découverte, le téléchargement, et le cycle de vie des composants Alfred"""
     
     def __init__(self, 
                  github_org: str = "alfred-project", 
                  base_path: str = "~/.alfred",
-                 sync_time: str = "03:00"):
+                 sync_time: str = "03:00",
+                 github_token: Optional[str] = None,
+                 max_concurrent_downloads: int = 10):
         """
         Initialise le Module Manager
         
@@ -42,22 +232,52 @@ class ModuleManager:
             github_org: Organisation ou utilisateur GitHub hébergeant les composants
             base_path: Répertoire de base pour les données Alfred
             sync_time: Heure de synchronisation nocturne (format 24h)
+            github_token: Token d'API GitHub (requis pour les requêtes GraphQL groupées)
+            max_concurrent_downloads: Nombre maximum de téléchargements simultanés lors de la synchronisation
         """
         self.github_org = github_org
+        self.github_token = github_token or os.environ.get("GITHUB_TOKEN")
+        self.github_headers = {'Authorization': f'token {self.github_token}'} if self.github_token else {}
+        
+        # Session HTTP partagée: réutilisation des connexions TLS et nouvelles tentatives
+        self.http = self._create_http_session()
         self.base_path = os.path.expanduser(base_path)
         self.sync_time = sync_time
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
         
         # Créer la structure de répertoires si elle n'existe pas
         self.cache_dir = os.path.join(self.base_path, "cache")
         self.backup_dir = os.path.join(self.base_path, "backups")
         self.config_file = os.path.join(self.base_path, "components.json")
+        self.journal_file = os.path.join(self.base_path, "components.wal")
         
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.backup_dir, exist_ok=True)
         
+        # Préfixes précalculés (avec séparateur final) pour construire les chemins dans les boucles
+        self._cache_prefix = os.path.join(self.cache_dir, "")
+        self._backup_prefix = os.path.join(self.backup_dir, "")
+        
         # Registre des composants: stocke les métadonnées de tous les composants disponibles
         self.registry = self._load_registry()
         
+        # Verrous protégeant le registre et les téléchargements lors de la synchronisation parallèle
+        self._registry_lock = threading.RLock()
+        self._download_locks: Dict[str, threading.Lock] = {}
+        
+        # Écritures différées du registre: modifications en attente et profondeur des lots ouverts
+        self._registry_dirty = False
+        self._registry_batch_depth = 0
+        
+        # Journal des modifications (ajout seul), ouvert à la première écriture
+        self._journal_fd: Optional[int] = None
+        
+        # Version du registre, incrémentée à chaque sauvegarde pour invalider les caches dérivés
+        self._registry_version = 0
+        
+        # Ordres de chargement résolus: ID -> (dépendances ordonnées, version du registre)
+        self._dep_cache: Dict[str, Tuple[Optional[List[str]], int]] = {}
+        
         # Composants actuellement chargés: nom -> objet module
         self.loaded_components = {}
         
@@ -71,43 +291,188 @@ class ModuleManager:
 
     def _load_registry(self) -> Dict:
         """Charge le registre des composants depuis le disque ou en crée un nouveau"""
+        registry = None
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    registry = _registry_loads(f.read())
             except json.JSONDecodeError:
                 logger.error(f"Fichier de registre corrompu: {self.config_file}")
                 # Sauvegarder le fichier corrompu
                 backup_name = f"components.json.corrupted.{int(time.time())}"
                 shutil.copy(self.config_file, os.path.join(self.base_path, backup_name))
         
-        # Retourner un registre vide si le fichier n'existe pas ou est corrompu
-        return {
-            "components": {},
-            "last_sync": None,
-            "github_org": self.github_org
-        }
+        # Utiliser un registre vide si le fichier n'existe pas ou est corrompu
+        if registry is None:
+            registry = {
+                "components": {},
+                "last_sync": None,
+                "github_org": self.github_org
+            }
+        
+        # Rejouer les modifications journalisées depuis le dernier instantané
+        self._replay_journal(registry)
+        return registry
+
+    def _replay_journal(self, registry: Dict) -> None:
+        """
+        Applique au registre les enregistrements du journal des modifications
+        
+        Args:
+            registry: Registre chargé depuis l'instantané components.json
+        """
+        if not os.path.exists(self.journal_file):
+            return
+        
+        replayed = 0
+        valid_size = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Dernier enregistrement tronqué par un arrêt brutal
+                    break
+                valid_size += len(line)
+                
+                try:
+                    record = _registry_loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Enregistrement illisible ignoré dans {self.journal_file}")
+                    continue
+                
+                try:
+                    if record.get("op") != "set":
+                        continue
+                    cid, fields = record["cid"], record["fields"]
+                    if not isinstance(fields, dict):
+                        raise TypeError("fields")
+                    registry["components"].setdefault(cid, {}).update(fields)
+                except (KeyError, TypeError, AttributeError):
+                    logger.warning(f"Enregistrement malformé ignoré dans {self.journal_file}")
+                    continue
+                replayed += 1
+        
+        # Retirer l'enregistrement tronqué pour que les ajouts suivants restent lisibles
+        if valid_size != os.path.getsize(self.journal_file):
+            logger.warning(f"Enregistrement tronqué retiré de {self.journal_file}")
+            os.truncate(self.journal_file, valid_size)
+        
+        if replayed:
+            logger.info(f"{replayed} modifications du registre rejouées depuis le journal")
+
+    def _record(self, component_id: str, **fields) -> None:
+        """
+        Modifie des champs d'un composant et ajoute la modification au journal,
+        sans réécrire tout le registre
+        
+        Args:
+            component_id: ID du composant (créé s'il n'existe pas)
+            **fields: Champs à mettre à jour
+        """
+        line = _journal_dumps({"op": "set", "cid": component_id, "fields": fields})
+        
+        with self._registry_lock:
+            self.registry["components"].setdefault(component_id, {}).update(fields)
+            self._registry_version += 1
+            
+            if self._journal_fd is None:
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_DSYNC", 0)
+                self._journal_fd = os.open(self.journal_file, flags, 0o644)
+            os.write(self._journal_fd, line)
+
+    def _compact(self) -> None:
+        """Réécrit l'instantané complet du registre et vide le journal des modifications"""
+        with self._registry_lock:
+            journal_pending = os.path.exists(self.journal_file) and os.path.getsize(self.journal_file) > 0
+            if journal_pending or not os.path.exists(self.config_file):
+                self._registry_dirty = True
+            self._flush_registry()
 
     def _save_registry(self) -> None:
-        """Sauvegarde le registre des composants sur le disque"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.registry, f, indent=2)
+        """Sauvegarde le registre des composants sur le disque (différé si un lot est ouvert)"""
+        with self._registry_lock:
+            self._registry_dirty = True
+            self._registry_version += 1
+            if self._registry_batch_depth == 0:
+                self._flush_registry()
+
+    def _flush_registry(self) -> None:
+        """Écrit le registre sur le disque s'il a été modifié depuis la dernière écriture"""
+        with self._registry_lock:
+            if not self._registry_dirty:
+                return
+            
+            # Écriture atomique de l'instantané, qui inclut toutes les modifications journalisées
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_registry_dumps(self.registry))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            
+            # Le journal peut alors être vidé (le rejouer sur l'instantané serait sans effet)
+            if self._journal_fd is not None:
+                os.ftruncate(self._journal_fd, 0)
+            elif os.path.exists(self.journal_file):
+                os.truncate(self.journal_file, 0)
+            
+            self._registry_dirty = False
         logger.debug("Registre sauvegardé sur le disque")
 
+    @contextmanager
+    def _registry_batch(self):
+        """Regroupe les sauvegardes du registre en une seule écriture à la sortie du lot"""
+        with self._registry_lock:
+            self._registry_batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._registry_lock:
+                self._registry_batch_depth -= 1
+                if self._registry_batch_depth == 0:
+                    self._flush_registry()
+
+    def _component_lock(self, component_id: str) -> threading.Lock:
+        """Récupère le verrou de téléchargement propre à un composant"""
+        with self._registry_lock:
+            return self._download_locks.setdefault(component_id, threading.Lock())
+
+    def _create_http_session(self) -> requests.Session:
+        """Crée la session HTTP partagée avec un pool de connexions et des nouvelles tentatives"""
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _setup_scheduler(self) -> None:
         """Configure le planificateur pour la synchronisation nocturne"""
-        schedule.every().day.at(self.sync_time).do(self.sync_all_components)
-        
-        # Démarrer le planificateur dans un thread en arrière-plan
-        def run_scheduler():
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Vérifier chaque minute
-                
-        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        scheduler_thread.start()
+        self._sync_timer = None
+        self._schedule_next_sync()
         logger.info(f"Planificateur démarré, synchronisation nocturne programmée pour {self.sync_time}")
 
+    def _schedule_next_sync(self) -> None:
+        """Arme un minuteur unique jusqu'à la prochaine heure de synchronisation"""
+        hour, minute = (int(part) for part in self.sync_time.split(":"))
+        now = datetime.now()
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        
+        delay = (next_run - now).total_seconds()
+        self._sync_timer = threading.Timer(delay, self._run_sync)
+        self._sync_timer.daemon = True
+        self._sync_timer.start()
+        logger.debug(f"Prochaine synchronisation programmée pour {next_run.isoformat()}")
+
+    def _run_sync(self) -> None:
+        """Exécute la synchronisation nocturne puis programme la suivante"""
+        try:
+            self.sync_all_components()
+        finally:
+            self._schedule_next_sync()
+
     @log_execution_time
     def discover_available_components(self, force_refresh: bool = False) -> Dict:
         """
@@ -129,59 +494,74 @@ class ModuleManager:
         
         try:
             # Lister les dépôts dans l'organisation GitHub
-            # Dans une implémentation réelle, cela utiliserait l'API GitHub
-            response = requests.get(f"https://api.github.com/orgs/{self.github_org}/repos")
+            repos = self._list_org_repos()
             
-            if response.status_code != 200:
-                logger.error(f"Échec de récupération des dépôts: {response.status_code}")
+            if repos is None:
                 # Revenir aux données en cache
                 return self.registry["components"]
-                
-            repos = response.json()
             
-            # Traiter chaque dépôt pour voir s'il s'agit d'un composant Alfred
+            # Retenir uniquement les dépôts suivant la convention de nommage
+            candidates = {}
             for repo in repos:
                 repo_name = repo["name"]
+                if not repo_name.startswith(COMPONENT_REPO_PREFIXES):
+                    continue
                 
-                # Traiter uniquement les dépôts suivant la convention de nommage
-                if (repo_name.startswith("alfred-module-") or 
-                    repo_name.startswith("alfred-agent-") or 
-                    repo_name.startswith("alfred-provider-")):
-                    
-                    # Déterminer le type de composant
-                    if repo_name.startswith("alfred-module-"):
-                        component_type = "module"
-                    elif repo_name.startswith("alfred-agent-"):
-                        component_type = "agent"
-                    else:
-                        component_type = "provider"
-                    
-                    # Extraire l'ID du composant
-                    component_id = repo_name.split("-", 2)[2] if len(repo_name.split("-")) > 2 else repo_name
-                    
-                    # Obtenir les métadonnées du composant (généralement depuis un fichier metadata.json)
-                    try:
-                        metadata_url = f"https://raw.githubusercontent.com/{self.github_org}/{repo_name}/main/metadata.json"
-                        metadata_response = requests.get(metadata_url)
-                        
-                        if metadata_response.status_code == 200:
-                            metadata = metadata_response.json()
-                            
-                            # Ajouter au registre avec infos additionnelles
-                            self.registry["components"][component_id] = {
-                                "name": metadata.get("name", repo_name),
-                                "description": metadata.get("description", ""),
-                                "version": metadata.get("version", "0.1.0"),
-                                "repo_url": repo["html_url"],
-                                "component_type": component_type,
-                                "dependencies": metadata.get("dependencies", []),
-                                "provides": metadata.get("provides", []),
-                                "category": metadata.get("category", "general"),
-                                "last_updated": repo["updated_at"]
-                            }
-                            logger.info(f"Découvert {component_type}: {component_id}")
-                    except Exception as e:
-                        logger.error(f"Erreur lors du traitement du dépôt {repo_name}: {str(e)}")
+                # Déterminer le type de composant et extraire son ID
+                for prefix, component_type in _PREFIX_TO_TYPE.items():
+                    if repo_name.startswith(prefix):
+                        component_id = repo_name[len(prefix):]
+                        break
+                else:
+                    continue
+                
+                candidates[repo_name] = (component_id, component_type, repo)
+            
+            # Obtenir les métadonnées de tous les composants (fichiers metadata.json)
+            metadata_by_repo = {}
+            validators_by_repo = {}
+            if self.github_token:
+                metadata_by_repo = self._fetch_metadata_graphql(list(candidates))
+            else:
+                # L'API GraphQL exige une authentification: une requête conditionnelle
+                # par dépôt, en parallèle
+                components = self.registry["components"]
+                with ThreadPoolExecutor(max_workers=METADATA_FETCH_WORKERS) as executor:
+                    futures = {
+                        executor.submit(self._fetch_metadata, repo_name, components.get(component_id)): repo_name
+                        for repo_name, (component_id, _, _) in candidates.items()
+                    }
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result is not None:
+                            metadata_by_repo[futures[future]] = result[0]
+                            validators_by_repo[futures[future]] = result[1]
+            
+            for repo_name, (component_id, component_type, repo) in candidates.items():
+                metadata = metadata_by_repo.get(repo_name)
+                if metadata is None:
+                    continue
+                
+                # Ajouter au registre avec infos additionnelles
+                entry = {
+                    "name": metadata["name"],
+                    "description": metadata["description"],
+                    "version": metadata["version"],
+                    "repo_url": repo["html_url"],
+                    "component_type": component_type,
+                    "dependencies": metadata["dependencies"],
+                    "provides": metadata["provides"],
+                    "category": metadata["category"],
+                    "last_updated": repo["updated_at"]
+                }
+                # Validateurs HTTP (ETag / Last-Modified) pour les requêtes conditionnelles
+                entry.update(validators_by_repo.get(repo_name, {}))
+                # Empreinte fixée par pin_component_sha256, indépendante du dépôt
+                expected_sha256 = self.registry["components"].get(component_id, {}).get("expected_sha256")
+                if expected_sha256:
+                    entry["expected_sha256"] = expected_sha256
+                self.registry["components"][component_id] = entry
+                logger.info(f"Découvert {component_type}: {component_id}")
             
             # Mettre à jour l'heure de dernière synchronisation
             self.registry["last_sync"] = datetime.now().isoformat()
@@ -193,6 +573,207 @@ class ModuleManager:
             logger.error(f"Erreur lors de la découverte des composants: {str(e)}", exc_info=True)
             return self.registry["components"]  # Retourner les données en cache
             
+    def _list_org_repos(self) -> Optional[List[Dict]]:
+        """
+        Liste tous les dépôts de l'organisation GitHub (API REST paginée)
+        
+        Returns:
+            Liste des dépôts, ou None si la récupération a échoué
+        """
+        repos = []
+        url = f"{GITHUB_API_URL}/orgs/{self.github_org}/repos"
+        params = {"per_page": 100}
+        
+        # Pages déjà reçues, indexées par URL, avec leurs validateurs HTTP
+        cached_pages = self.registry.setdefault("repo_pages", {})
+        
+        while url:
+            page_key = f"{url}?per_page=100" if params else url
+            cached = cached_pages.get(page_key)
+            with self.http.get(url, params=params, stream=True,
+                               headers=self._conditional_headers(self.github_headers, cached)) as response:
+                
+                if response.status_code == 304 and cached:
+                    # Page inchangée: réponse sans corps, non décomptée de la limite d'API
+                    repos.extend(cached["repos"])
+                    url = cached.get("next")
+                    params = None
+                    continue
+                
+                if response.status_code != 200:
+                    logger.error(f"Échec de récupération des dépôts: {response.status_code}")
+                    return None
+                
+                # Ne conserver que les dépôts de composants et les champs utilisés par la découverte
+                page = [
+                    {"name": repo["name"], "html_url": repo["html_url"], "updated_at": repo["updated_at"]}
+                    for repo in self._iter_repos(response)
+                    if repo["name"].startswith(COMPONENT_REPO_PREFIXES)
+                ]
+                repos.extend(page)
+                
+                # L'URL de la page suivante contient déjà les paramètres de pagination
+                next_url = response.links.get("next", {}).get("url")
+            cached_pages[page_key] = {
+                "repos": page,
+                "next": next_url,
+                **self._response_validators(response)
+            }
+            url = next_url
+            params = None
+        
+        return repos
+
+    @staticmethod
+    def _iter_repos(response: requests.Response):
+        """
+        Parcourt les dépôts d'une page de l'API sans matérialiser toute la réponse
+        
+        Args:
+            response: Réponse HTTP ouverte en mode flux
+            
+        Returns:
+            Itérable des dépôts de la page
+        """
+        if IJSON_AVAILABLE:
+            response.raw.decode_content = True
+            return ijson.items(response.raw, "item")
+        return response.json()
+
+    @staticmethod
+    def _conditional_headers(headers: Dict[str, str], cached: Optional[Dict]) -> Dict[str, str]:
+        """
+        Ajoute les en-têtes de requête conditionnelle à partir des validateurs en cache
+        
+        Args:
+            headers: En-têtes de base de la requête
+            cached: Entrée en cache contenant éventuellement "etag" et "last_modified"
+            
+        Returns:
+            En-têtes complétés par If-None-Match / If-Modified-Since
+        """
+        if not cached:
+            return headers
+        
+        headers = dict(headers)
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    @staticmethod
+    def _response_validators(response: requests.Response) -> Dict[str, str]:
+        """Extrait les validateurs HTTP (ETag / Last-Modified) d'une réponse"""
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["last_modified"] = response.headers["Last-Modified"]
+        return validators
+
+    def _graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Exécute une requête sur l'API GraphQL de GitHub
+        
+        Args:
+            query: Texte de la requête GraphQL
+            variables: Variables de la requête
+            
+        Returns:
+            Champ "data" de la réponse, ou None en cas d'échec
+        """
+        response = self.http.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables or {}},
+            headers=self.github_headers
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Échec de la requête GraphQL: {response.status_code}")
+            return None
+        
+        payload = response.json()
+        if payload.get("errors"):
+            # Les dépôts introuvables produisent une erreur mais n'invalident pas les autres nœuds
+            logger.warning(f"Erreurs GraphQL: {payload['errors']}")
+        
+        return payload.get("data")
+
+    def _fetch_metadata_graphql(self, repo_names: List[str]) -> Dict[str, Dict]:
+        """
+        Récupère les fichiers metadata.json de plusieurs dépôts via des requêtes GraphQL groupées
+        
+        Args:
+            repo_names: Noms des dépôts à interroger
+            
+        Returns:
+            Dictionnaire nom de dépôt -> métadonnées
+        """
+        metadata_by_repo = {}
+        
+        for start in range(0, len(repo_names), GRAPHQL_BATCH_SIZE):
+            batch = repo_names[start:start + GRAPHQL_BATCH_SIZE]
+            
+            # Un nœud "repository" aliasé par dépôt
+            nodes = [
+                f'repo{i}: repository(owner: $owner, name: {json.dumps(name)}) '
+                '{ object(expression: "main:metadata.json") { ... on Blob { text } } }'
+                for i, name in enumerate(batch)
+            ]
+            query = "query($owner: String!) {\n" + "\n".join(nodes) + "\n}"
+            
+            data = self._graphql(query, {"owner": self.github_org})
+            if not data:
+                continue
+            
+            for i, repo_name in enumerate(batch):
+                node = data.get(f"repo{i}") or {}
+                blob = node.get("object") or {}
+                text = blob.get("text")
+                if text is None:
+                    continue
+                
+                try:
+                    metadata_by_repo[repo_name] = _parse_metadata(text, repo_name)
+                except ValueError as e:
+                    logger.error(f"Métadonnées invalides pour le dépôt {repo_name}: {str(e)}")
+        
+        return metadata_by_repo
+
+    def _fetch_metadata(self, repo_name: str,
+                        cached: Optional[Dict] = None) -> Optional[Tuple[Dict, Dict[str, str]]]:
+        """
+        Récupère le fichier metadata.json d'un dépôt par une requête conditionnelle
+        
+        Args:
+            repo_name: Nom du dépôt
+            cached: Entrée du registre connue pour ce composant, le cas échéant
+            
+        Returns:
+            Tuple (métadonnées, validateurs HTTP), ou None si indisponibles
+        """
+        try:
+            metadata_url = f"https://raw.githubusercontent.com/{self.github_org}/{repo_name}/main/metadata.json"
+            metadata_response = self.http.get(metadata_url, headers=self._conditional_headers({}, cached))
+            
+            if metadata_response.status_code == 304 and cached:
+                # Inchangé: l'entrée du registre porte les mêmes champs que metadata.json
+                metadata = {field: cached.get(field, default) for field, default in _METADATA_DEFAULTS.items()}
+                return metadata, {k: cached[k] for k in ("etag", "last_modified") if k in cached}
+            
+            if metadata_response.status_code == 200:
+                try:
+                    metadata = _parse_metadata(metadata_response.content, repo_name)
+                except ValueError as e:
+                    logger.error(f"Métadonnées invalides pour le dépôt {repo_name}: {str(e)}")
+                    return None
+                return metadata, self._response_validators(metadata_response)
+        except Exception as e:
+            logger.error(f"Erreur lors du traitement du dépôt {repo_name}: {str(e)}")
+        
+        return None
+
     @log_execution_time
     def download_component(self, component_id: str, version: Optional[str] = None) -> bool:
         """
@@ -205,6 +786,12 @@ class ModuleManager:
         Returns:
             True si succès, False sinon
         """
+        # Une seule écriture du registre pour le composant et ses dépendances
+        with self._registry_batch():
+            return self._download_component(component_id, version)
+
+    def _download_component(self, component_id: str, version: Optional[str]) -> bool:
+        """Implémentation de download_component, appelée dans un lot d'écritures du registre"""
         if component_id not in self.registry["components"]:
             # Tenter de découvrir si le composant est inconnu
             self.discover_available_components()
@@ -218,72 +805,98 @@ class ModuleManager:
         
         # Déterminer la version à télécharger
         target_version = version or component_info["version"]
+        was_available = component_info.get("locally_available", False)
         
         try:
-            # Créer un répertoire temporaire pour le téléchargement
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Dans une implémentation réelle, cela téléchargerait un zip depuis une release GitHub ou un tag spécifique
-                # Pour simplifier, cet exemple utilise un téléchargement direct depuis la branche main
-                
-                # Déterminer l'URL de téléchargement (simplifié)
-                repo_name = f"alfred-{component_type}-{component_id}"
-                download_url = f"https://github.com/{self.github_org}/{repo_name}/archive/refs/heads/main.zip"
-                
-                # Télécharger le fichier zip
-                zip_path = os.path.join(temp_dir, f"{component_id}.zip")
-                response = requests.get(download_url, stream=True)
+            # Un seul téléchargement à la fois par composant (synchronisation parallèle);
+            # le verrou est relâché avant de descendre dans les dépendances
+            with self._component_lock(component_id):
+                # Téléchargé par un autre fil pendant l'attente du verrou (dépendance partagée)
+                if not was_available and self.registry["components"][component_id].get("locally_available", False):
+                    logger.debug(f"Composant {component_id} déjà téléchargé par un autre fil")
+                    return True
                 
-                if response.status_code != 200:
-                    logger.error(f"Échec du téléchargement du composant {component_id}: {response.status_code}")
-                    return False
+                # Créer un répertoire temporaire pour le téléchargement
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    # Dans une implémentation réelle, cela téléchargerait un zip depuis une release GitHub ou un tag spécifique
+                    # Pour simplifier, cet exemple utilise un téléchargement direct depuis la branche main
                     
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                # Extraire le fichier zip
-                import zipfile
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # Déplacer vers le répertoire cache
-                component_cache_dir = os.path.join(self.cache_dir, component_id)
-                if os.path.exists(component_cache_dir):
-                    shutil.rmtree(component_cache_dir)
-                
-                # Trouver le répertoire extrait
-                extracted_dir = None
-                for item in os.listdir(temp_dir):
-                    item_path = os.path.join(temp_dir, item)
-                    if os.path.isdir(item_path) and item != "__MACOSX":  # Ignorer les métadonnées macOS
-                        extracted_dir = item_path
-                        break
-                
-                if not extracted_dir:
-                    logger.error(f"Impossible de trouver le contenu extrait pour {component_id}")
-                    return False
-                
-                shutil.move(extracted_dir, component_cache_dir)
-                
-                # Mettre à jour le registre local avec les infos de téléchargement
-                self.registry["components"][component_id]["locally_available"] = True
-                self.registry["components"][component_id]["local_path"] = component_cache_dir
-                self.registry["components"][component_id]["download_time"] = datetime.now().isoformat()
-                self._save_registry()
-                
-                logger.info(f"Téléchargement réussi du composant {component_id} version {target_version}")
-                
-                # Vérifier et télécharger les dépendances
-                dependencies = component_info.get("dependencies", [])
-                if dependencies:
-                    logger.info(f"Résolution des dépendances pour {component_id}: {dependencies}")
-                    for dep_id in dependencies:
-                        if dep_id not in self.registry["components"] or not self.registry["components"][dep_id].get("locally_available", False):
-                            logger.info(f"Téléchargement de la dépendance: {dep_id}")
-                            self.download_component(dep_id)
-                
-                return True
-                
+                    # Déterminer l'URL de téléchargement (simplifié)
+                    repo_name = f"alfred-{component_type}-{component_id}"
+                    download_url = f"https://github.com/{self.github_org}/{repo_name}/archive/refs/heads/main.zip"
+                    
+                    # Télécharger le fichier zip dans un tampon en mémoire (sur disque au-delà du seuil)
+                    with self.http.get(download_url, stream=True) as response, \
+                            tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_SIZE) as buf:
+                        
+                        if response.status_code != 200:
+                            logger.error(f"Échec du téléchargement du composant {component_id}: {response.status_code}")
+                            return False
+                        
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, buf, length=1 << 20)
+                        buf.seek(0)
+                        
+                        # Vérifier l'intégrité de l'archive avant extraction
+                        archive_sha256 = _sha256_fileobj(buf)
+                        expected_sha256 = component_info.get("expected_sha256")
+                        if expected_sha256 and archive_sha256 != expected_sha256.lower():
+                            logger.error(f"Empreinte SHA-256 invalide pour le composant {component_id}: "
+                                         f"{archive_sha256} au lieu de {expected_sha256}")
+                            return False
+                        buf.seek(0)
+                        
+                        # Extraire le fichier zip directement depuis le tampon
+                        with zipfile.ZipFile(buf) as zip_ref:
+                            zip_ref.extractall(temp_dir)
+                    
+                    # Déplacer vers le répertoire cache
+                    component_cache_dir = f"{self._cache_prefix}{component_id}"
+                    if os.path.exists(component_cache_dir):
+                        shutil.rmtree(component_cache_dir)
+                    
+                    # Trouver le répertoire extrait
+                    extracted_dir = None
+                    for item in os.listdir(temp_dir):
+                        item_path = os.path.join(temp_dir, item)
+                        if os.path.isdir(item_path) and item != "__MACOSX":  # Ignorer les métadonnées macOS
+                            extracted_dir = item_path
+                            break
+                    
+                    if not extracted_dir:
+                        logger.error(f"Impossible de trouver le contenu extrait pour {component_id}")
+                        return False
+                    
+                    shutil.move(extracted_dir, component_cache_dir)
+                    
+                    # Précompiler le bytecode (__pycache__) pour que le chargement évite l'analyse du source
+                    main_file = self._find_main_file(component_cache_dir)
+                    compileall.compile_dir(component_cache_dir, quiet=1)
+                    
+                    # Mettre à jour le registre local avec les infos de téléchargement
+                    self._record(
+                        component_id,
+                        locally_available=True,
+                        local_path=component_cache_dir,
+                        download_time=datetime.now().isoformat(),
+                        sha256=archive_sha256,
+                        main_file=main_file
+                    )
+                    
+                    logger.info(f"Téléchargement réussi du composant {component_id} version {target_version}")
+                    
+            
+            # Vérifier et télécharger les dépendances
+            dependencies = component_info.get("dependencies", [])
+            if dependencies:
+                logger.info(f"Résolution des dépendances pour {component_id}: {dependencies}")
+                for dep_id in dependencies:
+                    if dep_id not in self.registry["components"] or not self.registry["components"][dep_id].get("locally_available", False):
+                        logger.info(f"Téléchargement de la dépendance: {dep_id}")
+                        self.download_component(dep_id)
+            
+            return True
+            
         except Exception as e:
             logger.error(f"Erreur lors du téléchargement du composant {component_id}: {str(e)}", exc_info=True)
             return False
@@ -324,30 +937,25 @@ class ModuleManager:
             logger.error(f"Impossible de résoudre les dépendances pour {component_id}")
             return None
             
-        # Charger toutes les dépendances d'abord
+        # Charger toutes les dépendances d'abord (test d'appartenance direct, sans appel de méthode)
+        loaded_components = self.loaded_components
         for dep_id in dependencies:
-            if not self.is_component_loaded(dep_id):
+            if dep_id not in loaded_components:
                 if not self.load_component(dep_id):
                     logger.error(f"Échec du chargement de la dépendance {dep_id} pour le composant {component_id}")
                     return None
         
         try:
-            # Déterminer le fichier principal du module
-            module_path = component_info["local_path"]
-            main_file = os.path.join(module_path, "main.py")
-            
-            if not os.path.exists(main_file):
-                # Chercher un autre fichier principal
-                for filename in os.listdir(module_path):
-                    if filename.endswith(".py") and filename != "__init__.py":
-                        main_file = os.path.join(module_path, filename)
-                        break
+            # Déterminer le fichier principal du module (mémorisé au téléchargement)
+            main_file = component_info.get("main_file")
+            if not main_file or not os.path.exists(main_file):
+                main_file = self._find_main_file(component_info["local_path"])
             
-            if not os.path.exists(main_file):
+            if not main_file:
                 logger.error(f"Impossible de trouver le fichier principal pour le composant {component_id}")
                 return None
                 
-            # Charger le module
+            # Charger le module (le chargeur réutilise le bytecode précompilé tant que le source n'a pas changé)
             spec = importlib.util.spec_from_file_location(component_id, main_file)
             module = importlib.util.module_from_spec(spec)
             sys.modules[component_id] = module
@@ -392,6 +1000,28 @@ class ModuleManager:
             logger.error(f"Erreur lors du chargement du composant {component_id}: {str(e)}", exc_info=True)
             return None
 
+    @staticmethod
+    def _find_main_file(module_path: str) -> Optional[str]:
+        """
+        Détermine le fichier principal d'un composant
+        
+        Args:
+            module_path: Répertoire du composant
+            
+        Returns:
+            Chemin du fichier principal, ou None si introuvable
+        """
+        main_file = os.path.join(module_path, "main.py")
+        if os.path.exists(main_file):
+            return main_file
+        
+        # Chercher un autre fichier principal
+        for filename in os.listdir(module_path):
+            if filename.endswith(".py") and filename != "__init__.py":
+                return os.path.join(module_path, filename)
+        
+        return None
+
     def unload_component(self, component_id: str) -> bool:
         """
         Décharge un composant de la mémoire
@@ -473,43 +1103,66 @@ class ModuleManager:
             logger.error(f"Composant inconnu: {component_id}")
             return None
             
+        cached = self._dep_cache.get(component_id)
+        if cached is not None and cached[1] == self._registry_version:
+            return list(cached[0]) if cached[0] is not None else None
+        
+        resolved = self._topological_dependencies(component_id)
+        self._dep_cache[component_id] = (resolved, self._registry_version)
+        return list(resolved) if resolved is not None else None
+
+    def _topological_dependencies(self, component_id: str) -> Optional[List[str]]:
+        """
+        Calcule l'ordre de chargement des dépendances transitives (tri topologique de Kahn)
+        
+        Args:
+            component_id: ID du composant
+            
+        Returns:
+            Liste ordonnée des dépendances, ou None en cas de dépendance circulaire
+        """
+        components = self.registry["components"]
+        
         # Récupérer les dépendances directes
-        direct_deps = self.registry["components"][component_id].get("dependencies", [])
+        direct_deps = components[component_id].get("dependencies", [])
         
         if not direct_deps:
             return []
-            
-        # Résoudre l'ordre de chargement (tri topologique)
+        
+        # Fermeture transitive des dépendances, dans l'ordre de découverte
+        nodes = {}
+        stack = list(reversed(direct_deps))
+        while stack:
+            cid = stack.pop()
+            if cid in nodes:
+                continue
+            deps = list(dict.fromkeys(components.get(cid, {}).get("dependencies", [])))
+            nodes[cid] = deps
+            stack.extend(reversed(deps))
+        
+        # Degré entrant = nombre de dépendances restant à charger
+        in_degree = {cid: len(deps) for cid, deps in nodes.items()}
+        dependents = {cid: [] for cid in nodes}
+        for cid, deps in nodes.items():
+            for dep in deps:
+                dependents[dep].append(cid)
+        
+        queue = deque(cid for cid, degree in in_degree.items() if degree == 0)
         resolved = []
-        visited = set()
-        temp_marked = set()
+        while queue:
+            cid = queue.popleft()
+            resolved.append(cid)
+            for dependent in dependents[cid]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        
+        if len(resolved) != len(nodes):
+            # Les composants restants appartiennent à un cycle ou en dépendent
+            blocked = [cid for cid, degree in in_degree.items() if degree > 0]
+            logger.error(f"Dépendance circulaire détectée pour {component_id} parmi: {', '.join(blocked)}")
+            return None
         
-        def visit(cid):
-            if cid in temp_marked:
-                logger.error(f"Dépendance circulaire détectée pour {cid}")
-                return False
-                
-            if cid not in visited:
-                temp_marked.add(cid)
-                
-                # Visiter toutes les dépendances de ce composant
-                if cid in self.registry["components"]:
-                    deps = self.registry["components"][cid].get("dependencies", [])
-                    for dep in deps:
-                        if not visit(dep):
-                            return False
-                            
-                temp_marked.remove(cid)
-                visited.add(cid)
-                resolved.append(cid)
-                
-            return True
-            
-        # Visiter chaque dépendance
-        for dep in direct_deps:
-            if not visit(dep):
-                return None
-                
         return resolved
 
     @log_execution_time
@@ -523,43 +1176,61 @@ class ModuleManager:
         logger.info("Début de la synchronisation nocturne des composants")
         
         try:
-            # Découvrir les composants disponibles
-            self.discover_available_components(force_refresh=True)
-            
-            # Créer un répertoire de sauvegarde daté
-            backup_date = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = os.path.join(self.backup_dir, f"backup_{backup_date}")
-            os.makedirs(backup_path, exist_ok=True)
-            
-            # Télécharger tous les composants qui ne sont pas déjà téléchargés ou qui ont besoin d'une mise à jour
-            for component_id, component_info in self.registry["components"].items():
-                # Ignorer si disponible localement et à jour
-                if component_info.get("locally_available", False):
-                    local_version = component_info.get("version", "0.0.0")
-                    remote_version = component_info.get("version", "0.0.0")
+            # Regrouper les écritures du registre: une seule à la fin des téléchargements
+            with self._registry_batch():
+                # Découvrir les composants disponibles
+                self.discover_available_components(force_refresh=True)
+                
+                # Sauvegarde précédente, dont les fichiers inchangés seront partagés par liens physiques
+                previous_backups = self._list_backups()
+                previous_prefix = f"{previous_backups[0].path}{os.sep}" if previous_backups else None
+                
+                # Créer un répertoire de sauvegarde daté
+                backup_date = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_path = f"{self._backup_prefix}backup_{backup_date}"
+                backup_prefix = f"{backup_path}{os.sep}"
+                os.makedirs(backup_path, exist_ok=True)
+                
+                # Télécharger tous les composants qui ne sont pas déjà téléchargés ou qui ont besoin d'une mise à jour
+                to_update = []
+                for component_id, component_info in self.registry["components"].items():
+                    # Ignorer si disponible localement et à jour
+                    if component_info.get("locally_available", False):
+                        local_version = component_info.get("version", "0.0.0")
+                        remote_version = component_info.get("version", "0.0.0")
+                        
+                        # Si les versions correspondent, ignorer le téléchargement
+                        if local_version == remote_version:
+                            logger.debug(f"Composant {component_id} à jour, téléchargement ignoré")
+                            
+                            # Copier quand même dans la sauvegarde
+                            local_path = component_info.get("local_path")
+                            if local_path and os.path.exists(local_path):
+                                self._link_backup(local_path, f"{backup_prefix}{component_id}",
+                                                  f"{previous_prefix}{component_id}" if previous_prefix else None)
+                            
+                            continue
                     
-                    # Si les versions correspondent, ignorer le téléchargement
-                    if local_version == remote_version:
-                        logger.debug(f"Composant {component_id} à jour, téléchargement ignoré")
+                    to_update.append(component_id)
+                
+                # Télécharger ou mettre à jour les composants en parallèle (limite de débit secondaire de GitHub)
+                with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as executor:
+                    futures = {executor.submit(self._sync_download, component_id): component_id
+                               for component_id in to_update}
+                    for future in as_completed(futures):
+                        component_id = futures[future]
+                        if not future.result():
+                            continue
                         
-                        # Copier quand même dans la sauvegarde
-                        local_path = component_info.get("local_path")
+                        # Copier dans la sauvegarde
+                        local_path = self.registry["components"][component_id].get("local_path")
                         if local_path and os.path.exists(local_path):
-                            backup_component_path = os.path.join(backup_path, component_id)
-                            shutil.copytree(local_path, backup_component_path)
-                        
-                        continue
+                            self._link_backup(local_path, f"{backup_prefix}{component_id}",
+                                              f"{previous_prefix}{component_id}" if previous_prefix else None)
                 
-                # Télécharger ou mettre à jour le composant
-                if self.download_component(component_id):
-                    # Copier dans la sauvegarde
-                    local_path = self.registry["components"][component_id].get("local_path")
-                    if local_path and os.path.exists(local_path):
-                        backup_component_path = os.path.join(backup_path, component_id)
-                        shutil.copytree(local_path, backup_component_path)
-            
-            # Sauvegarder le registre
-            shutil.copy(self.config_file, os.path.join(backup_path, "components.json"))
+            # Compacter le journal dans l'instantané, puis sauvegarder le registre
+            self._compact()
+            shutil.copy(self.config_file, f"{backup_prefix}components.json")
             
             # Gérer la rotation des sauvegardes (conserver les 7 dernières)
             self._rotate_backups(max_backups=7)
@@ -571,6 +1242,75 @@ class ModuleManager:
             logger.error(f"Erreur durant la synchronisation des composants: {str(e)}", exc_info=True)
             return False
 
+    def _sync_download(self, component_id: str) -> bool:
+        """
+        Télécharge un composant pour la synchronisation, sauf s'il vient de l'être
+        comme dépendance d'un autre composant
+        
+        Args:
+            component_id: ID du composant
+            
+        Returns:
+            True si le composant est disponible localement, False sinon
+        """
+        if self.registry["components"][component_id].get("locally_available", False):
+            return True
+        return self.download_component(component_id)
+
+    def _link_backup(self, src: str, dst: str, prev_backup: Optional[str]) -> None:
+        """
+        Copie un composant dans une sauvegarde, en liant physiquement les fichiers
+        inchangés depuis la sauvegarde précédente
+        
+        Args:
+            src: Répertoire du composant dans le cache
+            dst: Répertoire de destination dans la nouvelle sauvegarde
+            prev_backup: Répertoire du composant dans la sauvegarde précédente, le cas échéant
+        """
+        src = src.rstrip(os.sep)
+        src_len = len(src)
+        for root, dirs, files in os.walk(src):
+            # Suffixe relatif du répertoire courant ("" pour la racine, sinon "/sous/rep")
+            rel_root = root[src_len:]
+            os.makedirs(f"{dst}{rel_root}", exist_ok=True)
+            
+            src_prefix = f"{root}{os.sep}"
+            dst_prefix = f"{dst}{rel_root}{os.sep}"
+            prev_prefix = f"{prev_backup}{rel_root}{os.sep}" if prev_backup else None
+            
+            for filename in files:
+                src_file = f"{src_prefix}{filename}"
+                dst_file = f"{dst_prefix}{filename}"
+                
+                if prev_prefix:
+                    prev_file = f"{prev_prefix}{filename}"
+                    try:
+                        # Comparaison par stat (taille, mtime) puis par contenu si elles diffèrent,
+                        # car l'extraction d'une archive retéléchargée ne conserve pas les dates
+                        if filecmp.cmp(src_file, prev_file, shallow=True):
+                            os.link(prev_file, dst_file)
+                            continue
+                    except OSError:
+                        # Fichier absent de la sauvegarde précédente ou liens non supportés
+                        pass
+                
+                _fast_copy(src_file, dst_file)
+
+    def _list_backups(self) -> List[os.DirEntry]:
+        """
+        Liste les répertoires de sauvegarde en un seul parcours du répertoire
+        
+        Returns:
+            Entrées des sauvegardes, triées par date de création (plus récentes d'abord)
+        """
+        with os.scandir(self.backup_dir) as entries:
+            backups = [entry for entry in entries
+                       if entry.name.startswith("backup_") and entry.is_dir()]
+        
+        # DirEntry met en cache le résultat de stat()
+        backups.sort(key=lambda entry: entry.stat().st_ctime, reverse=True)
+        return backups
+
     def _rotate_backups(self, max_backups: int = 7) -> None:
         """
         Effectue une rotation des sauvegardes, ne gardant que les plus récentes
@@ -578,17 +1318,9 @@ class ModuleManager:
         Args:
             max_backups: Nombre maximum de sauvegardes à conserver
         """
-        backups = []
-        for item in os.listdir(self.backup_dir):
-            item_path = os.path.join(self.backup_dir, item)
-            if os.path.isdir(item_path) and item.startswith("backup_"):
-                backups.append((item_path, os.path.getctime(item_path)))
-        
-        # Trier par date de création (plus récentes d'abord)
-        backups.sort(key=lambda x: x[1], reverse=True)
-        
         # Supprimer les sauvegardes les plus anciennes au-delà de la limite
-        for backup_path, _ in backups[max_backups:]:
+        for entry in self._list_backups()[max_backups:]:
+            backup_path = entry.path
             try:
                 shutil.rmtree(backup_path)
                 logger.debug(f"Ancienne sauvegarde supprimée: {backup_path}")
@@ -612,35 +1344,29 @@ class ModuleManager:
         try:
             # Trouver la sauvegarde la plus récente contenant ce composant
             latest_backup = None
-            latest_time = 0
             
-            for item in os.listdir(self.backup_dir):
-                item_path = os.path.join(self.backup_dir, item)
-                
-                if os.path.isdir(item_path) and item.startswith("backup_"):
-                    component_backup_path = os.path.join(item_path, component_id)
-                    
-                    if os.path.exists(component_backup_path):
-                        backup_time = os.path.getctime(item_path)
-                        if backup_time > latest_time:
-                            latest_time = backup_time
-                            latest_backup = component_backup_path
+            for entry in self._list_backups():
+                component_backup_path = f"{entry.path}{os.sep}{component_id}"
+                if os.path.exists(component_backup_path):
+                    latest_backup = component_backup_path
+                    break
             
             if not latest_backup:
                 logger.error(f"Aucune sauvegarde trouvée pour le composant {component_id}")
                 return False
                 
             # Copier depuis la sauvegarde vers le cache
-            component_cache_dir = os.path.join(self.cache_dir, component_id)
+            component_cache_dir = f"{self._cache_prefix}{component_id}"
             if os.path.exists(component_cache_dir):
                 shutil.rmtree(component_cache_dir)
                 
-            shutil.copytree(latest_backup, component_cache_dir)
+            shutil.copytree(latest_backup, component_cache_dir, copy_function=_fast_copy)
             
             # Mettre à jour le registre
             # Si le composant n'a jamais été dans le registre, ajouter une entrée minimale
+            fields = {}
             if component_id not in self.registry["components"]:
-                self.registry["components"][component_id] = {
+                fields = {
                     "name": component_id,
                     "description": "Restauré depuis une sauvegarde",
                     "version": "unknown",
@@ -648,11 +1374,13 @@ class ModuleManager:
                     "from_backup": True
                 }
                 
-            self.registry["components"][component_id]["locally_available"] = True
-            self.registry["components"][component_id]["local_path"] = component_cache_dir
-            self.registry["components"][component_id]["fallback_used"] = True
-            self.registry["components"][component_id]["fallback_time"] = datetime.now().isoformat()
-            self._save_registry()
+            fields.update(
+                locally_available=True,
+                local_path=component_cache_dir,
+                fallback_used=True,
+                fallback_time=datetime.now().isoformat()
+            )
+            self._record(component_id, **fields)
             
             logger.info(f"Composant {component_id} restauré avec succès depuis la sauvegarde")
             return True
@@ -668,6 +1396,33 @@ class ModuleManager:
             
         return self.registry["components"][component_id]
 
+    def pin_component_sha256(self, component_id: str, sha256: Optional[str]) -> bool:
+        """
+        Fixe l'empreinte SHA-256 attendue pour l'archive d'un composant
+        
+        Les téléchargements suivants sont refusés si l'archive ne correspond pas.
+        L'empreinte est conservée lors des redécouvertes du composant.
+        
+        Args:
+            component_id: ID du composant
+            sha256: Empreinte hexadécimale attendue, ou None pour retirer la vérification
+            
+        Returns:
+            True si l'empreinte a été enregistrée, False sinon
+        """
+        if component_id not in self.registry["components"]:
+            logger.error(f"Composant inconnu: {component_id}")
+            return False
+        
+        if sha256 is not None:
+            sha256 = sha256.strip().lower()
+            if len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256):
+                logger.error(f"Empreinte SHA-256 invalide pour le composant {component_id}: {sha256}")
+                return False
+        
+        self._record(component_id, expected_sha256=sha256)
+        return True
+
     def list_available_components(self, component_type: Optional[str] = None, category: Optional[str] = None) -> List[Dict]:
         """
         Liste tous les composants disponibles
@@ -5,17 +5,37 @@ Module de communication centralisé pour Alfred.
 Gère les communications entre agents via Redis ou d'autres backends.
 """
 
+import asyncio
 import json
 import time
 import uuid
 import logging
 import threading
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from enum import Enum, auto
 
+# Sérialisation JSON accélérée (optionnelle)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configuration du logger
 logger = logging.getLogger("MessageBus")
 
+def _json_dumps(data: Any) -> Union[str, bytes]:
+    """Sérialise un message en JSON, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data)
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Désérialise un message JSON, via orjson si disponible."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class MessagePriority(Enum):
     """Niveau de priorité des messages."""
     LOW = auto()
@@ -53,6 +73,7 @@ class MessageBus:
         self.subscribers = {}  # topic -> [callbacks]
         self.running = False
         self.listener_thread = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # boucle des callbacks asynchrones
         
         # Initialisation du backend
         if backend_type == "redis":
@@ -120,21 +141,53 @@ class MessageBus:
                 message = pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
                 if message:
                     topic = message['channel']
-                    data = json.loads(message['data'])
+                    data = _json_loads(message['data'])
                     self._dispatch_message(topic, data)
             except Exception as e:
                 logger.error(f"Erreur lors de l'écoute des messages: {e}")
                 time.sleep(1)  # Pause avant de réessayer
     
+    def set_event_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Définit la boucle asyncio sur laquelle exécuter les callbacks asynchrones.
+        
+        Args:
+            loop: Boucle d'événements (None pour revenir à une exécution bloquante)
+        """
+        self.loop = loop
+    
     def _dispatch_message(self, topic: str, data: Dict[str, Any]) -> None:
         """Dispatche un message aux abonnés d'un topic."""
         if topic in self.subscribers:
             for callback in self.subscribers[topic]:
                 try:
-                    callback(data)
+                    result = callback(data)
+                    if asyncio.iscoroutine(result):
+                        self._schedule_coroutine(topic, result)
                 except Exception as e:
                     logger.error(f"Erreur dans le callback pour le topic {topic}: {e}")
     
+    def _schedule_coroutine(self, topic: str, coro) -> None:
+        """
+        Exécute un callback asynchrone sans bloquer le thread de dispatch.
+        
+        Args:
+            topic: Sujet du message (pour la journalisation des erreurs)
+            coro: Coroutine retournée par le callback
+        """
+        if self.loop is None or self.loop.is_closed():
+            # Pas de boucle attachée : exécution bloquante, comme un callback synchrone
+            asyncio.run(coro)
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        
+        def _log_error(fut):
+            if not fut.cancelled() and fut.exception() is not None:
+                logger.error(f"Erreur dans le callback pour le topic {topic}: {fut.exception()}")
+        
+        future.add_done_callback(_log_error)
+    
     def subscribe(self, topic: str, callback: Callable[[Dict[str, Any]], None]) -> None:
         """
         Abonne un callback à un topic.
@@ -153,6 +206,24 @@ class MessageBus:
         self.subscribers[topic].append(callback)
         logger.info(f"Abonné au topic: {topic}")
     
+    def register_handlers(self, handlers: Dict[str, Callable[[Dict[str, Any]], None]]) -> None:
+        """
+        Abonne plusieurs callbacks en une seule opération.
+        
+        Args:
+            handlers: Dictionnaire topic -> callback
+        """
+        new_topics = [topic for topic in handlers if topic not in self.subscribers]
+        for topic, callback in handlers.items():
+            self.subscribers.setdefault(topic, []).append(callback)
+        
+        # Un seul abonnement Redis pour l'ensemble des nouveaux topics
+        if new_topics and self.running and self.backend_type == "redis":
+            pubsub = self.backend.pubsub()
+            pubsub.subscribe(*new_topics)
+        
+        logger.info(f"Abonné aux topics: {list(handlers)}")
+    
     def unsubscribe(self, topic: str, callback: Optional[Callable] = None) -> None:
         """
         Désabonne un callback d'un topic.
@@ -197,7 +268,7 @@ class MessageBus:
         }
         
         if self.backend_type == "redis":
-            self.backend.publish(topic, json.dumps(message))
+            self.backend.publish(topic, _json_dumps(message))
         elif self.backend_type == "memory":
             if topic not in self.backend["messages"]:
                 self.backend["messages"][topic] = []
@@ -208,6 +279,48 @@ class MessageBus:
         logger.debug(f"Message publié sur {topic}: {message_type}")
         return message_id
     
+    def publish_batch(self, events: List[Tuple[str, Dict[str, Any]]],
+                      message_type: Union[str, MessageType] = MessageType.EVENT,
+                      priority: MessagePriority = MessagePriority.NORMAL) -> List[str]:
+        """
+        Publie plusieurs messages en un seul aller-retour vers le backend.
+        
+        Args:
+            events: Liste de couples (topic, données)
+            message_type: Type commun des messages
+            priority: Priorité commune des messages
+            
+        Returns:
+            IDs des messages publiés, dans l'ordre
+        """
+        if isinstance(message_type, MessageType):
+            message_type = message_type.value
+        
+        timestamp = time.time()
+        messages = []
+        for topic, data in events:
+            messages.append((topic, {
+                "id": str(uuid.uuid4()),
+                "type": message_type,
+                "priority": priority.value,
+                "timestamp": timestamp,
+                "data": data
+            }))
+        
+        if self.backend_type == "redis":
+            pipeline = self.backend.pipeline(transaction=False)
+            for topic, message in messages:
+                pipeline.publish(topic, _json_dumps(message))
+            pipeline.execute()
+        elif self.backend_type == "memory":
+            for topic, message in messages:
+                self.backend["messages"].setdefault(topic, []).append(message)
+                # Dispatche immédiatement en mémoire
+                self._dispatch_message(topic, message)
+        
+        logger.debug(f"{len(messages)} messages publiés en lot")
+        return [message["id"] for _, message in messages]
+    
     def send_command(self, target: str, command_type: str, 
                     data: Dict[str, Any], priority: MessagePriority = MessagePriority.NORMAL) -> str:
         """
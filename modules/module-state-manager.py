@@ -104,6 +104,20 @@ class StateManager:
                 logger.error(f"Erreur lors de la récupération de {path}: {e}")
                 return default
     
+    def get_many(self, paths: List[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Récupère plusieurs valeurs de l'état en une seule opération.
+        
+        Args:
+            paths: Chemins des données (notation point)
+            default: Valeur par défaut pour les chemins inexistants
+            
+        Returns:
+            Dictionnaire chemin -> valeur
+        """
+        with self.lock:
+            return {path: self.get(path, default) for path in paths}
+    
     def set(self, path: str, value: Any, save: bool = True) -> bool:
         """
         Définit une valeur dans l'état.
@@ -178,6 +192,31 @@ class StateManager:
                 logger.error(f"Erreur lors de la mise à jour de données: {e}")
                 return False
     
+    def set_many(self, values: Dict[str, Any], save: bool = True) -> bool:
+        """
+        Définit plusieurs valeurs en une seule opération.
+        
+        Contrairement à update(), les dictionnaires sont assignés tels quels
+        au chemin indiqué, sans être parcourus clé par clé.
+        
+        Args:
+            values: Dictionnaire chemin (notation point) -> valeur
+            save: Si True, sauvegarde l'état une seule fois après modification
+            
+        Returns:
+            True si toutes les valeurs ont été définies, False sinon
+        """
+        success = True
+        with self.lock:
+            for path, value in values.items():
+                success = self.set(path, value, False) and success
+            
+            # Sauvegarder une seule fois à la fin si demandé
+            if save and self.persistence_file and success:
+                self._save_state()
+                
+            return success
+    
     def delete(self, path: str, save: bool = True) -> bool:
         """
         Supprime une valeur de l'état.